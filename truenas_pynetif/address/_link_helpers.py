@@ -1,3 +1,4 @@
+import functools
 import socket
 import struct
 
@@ -5,17 +6,40 @@ from truenas_pynetif.address.constants import (
     AddressFamily,
     IFLAAttr,
     IFLAInfoAttr,
+    RTEXTFilter,
     RTMType,
 )
 from truenas_pynetif.netlink import DeviceNotFound
 from truenas_pynetif.netlink._core import (
+    _ACCEPT_NEWLINK,
+    _IFINFOMSG_UNSPEC,
+    _IFLA_IFNAME,
+    _NLATTR_HDR,
+    NLAttrFlags,
     NLMsgFlags,
-    pack_nlattr_nested,
     pack_nlattr_str,
+    pack_nlattr_u32,
     pack_nlmsg,
+    parse_attrs_into,
     recv_msgs,
+    send_batch,
 )
 
+# Complete messages packed in one call: nlmsghdr + ifinfomsg (+ one u32 nlattr)
+_LINK_MSG = struct.Struct("IHHII" "BxHiII")
+_LINK_U32_MSG = struct.Struct("IHHII" "4xi8x" "HHI")
+# nlmsghdr + AF_UNSPEC ifinfomsg, followed by caller supplied attributes
+_LINK_HDR = struct.Struct("IHHII" "4xi8x")
+
+# Link dump used for bulk name lookups
+_GETLINK_NAMES_DUMP = pack_nlmsg(
+    RTMType.GETLINK,
+    NLMsgFlags.REQUEST | NLMsgFlags.DUMP,
+    _IFINFOMSG_UNSPEC.pack(0)
+    + pack_nlattr_u32(IFLAAttr.EXT_MASK, RTEXTFilter.SKIP_STATS),
+)
+_IFNAME_SLOTS = _IFLA_IFNAME + 1
+
 
 def _resolve_index(name: str | None = None, index: int | None = None) -> int:
     """Resolve interface name to index, or return index if provided.
@@ -41,6 +65,79 @@ def _resolve_index(name: str | None = None, index: int | None = None) -> int:
         raise DeviceNotFound(f"No such device: {name}")
 
 
+def _resolve_indices_bulk(sock: socket.socket, names: list[str]) -> dict[str, int]:
+    """Resolve several interface names to indexes with a single RTM_GETLINK dump.
+
+    Names missing from the dump (e.g. alternative names) are looked up
+    individually.
+
+    Raises:
+        DeviceNotFound: If any of the named interfaces does not exist
+    """
+    sock.send(_GETLINK_NAMES_DUMP)
+
+    name2idx: dict[str, int] = {}
+    for _, payload in recv_msgs(sock, accept=_ACCEPT_NEWLINK):
+        if len(payload) < 16:
+            continue
+        # Only IFLA_IFNAME is needed, so skip building a dict of every attr
+        attrs: list[bytes | None] = [None] * _IFNAME_SLOTS
+        parse_attrs_into(payload, 16, attrs)
+        if (raw := attrs[_IFLA_IFNAME]) is not None:
+            ifname = raw.rstrip(b"\x00").decode("utf-8", errors="replace")
+            name2idx[ifname] = _IFINFOMSG_UNSPEC.unpack_from(payload)[0]
+
+    resolved = {}
+    for name in names:
+        try:
+            resolved[name] = name2idx[name]
+        except KeyError:
+            # Not a primary name; if_nametoindex() also matches altnames
+            resolved[name] = _resolve_index(name)
+    return resolved
+
+
+@functools.lru_cache(maxsize=16)
+def _kind_attr(kind: str) -> bytes:
+    return pack_nlattr_str(IFLAInfoAttr.KIND, kind)
+
+
+def _build_linkinfo(kind: str, info_data: bytes = b"") -> bytes:
+    """Pack IFLA_LINKINFO holding IFLA_INFO_KIND and optional IFLA_INFO_DATA.
+
+    `info_data` is a sequence of already padded attributes, so both nested
+    attributes stay 4-byte aligned without extra padding.
+    """
+    kind_attr = _kind_attr(kind)
+    if not info_data:
+        return (
+            _NLATTR_HDR.pack(
+                4 + len(kind_attr), IFLAAttr.LINKINFO | NLAttrFlags.NESTED
+            )
+            + kind_attr
+        )
+    data_len = 4 + len(info_data)
+    return b"".join(
+        (
+            _NLATTR_HDR.pack(
+                4 + len(kind_attr) + data_len, IFLAAttr.LINKINFO | NLAttrFlags.NESTED
+            ),
+            kind_attr,
+            _NLATTR_HDR.pack(data_len, IFLAInfoAttr.DATA | NLAttrFlags.NESTED),
+            info_data,
+        )
+    )
+
+
+def _linkinfo_option_prefix(kind: str) -> bytes:
+    """Return the IFLA_LINKINFO headers framing a single 8-byte option.
+
+    Appending one pack_nlattr_u8/u16/u32() attribute yields a complete
+    IFLA_LINKINFO carrying that option in IFLA_INFO_DATA.
+    """
+    return _build_linkinfo(kind, bytes(8))[:-8]
+
+
 def _create_link(
     sock: socket.socket,
     name: str,
@@ -48,24 +145,34 @@ def _create_link(
     *,
     info_data: bytes = b"",
     extra_attrs: bytes = b"",
-) -> None:
-    """Create a virtual interface via RTM_NEWLINK."""
-    # ifinfomsg: family(1) + pad(1) + type(2) + index(4) + flags(4) + change(4)
-    ifinfomsg = struct.pack("BxHiII", AddressFamily.UNSPEC, 0, 0, 0, 0)
-
-    # Build IFLA_LINKINFO nested attribute
-    linkinfo_attrs = pack_nlattr_str(IFLAInfoAttr.KIND, kind)
-    if info_data:
-        linkinfo_attrs += pack_nlattr_nested(IFLAInfoAttr.DATA, info_data)
+) -> int:
+    """Create a virtual interface via RTM_NEWLINK and return its index."""
+    ifinfomsg = _IFINFOMSG_UNSPEC.pack(0)
 
-    attrs = pack_nlattr_str(IFLAAttr.IFNAME, name)
-    attrs += extra_attrs
-    attrs += pack_nlattr_nested(IFLAAttr.LINKINFO, linkinfo_attrs)
+    attrs = b"".join(
+        (
+            pack_nlattr_str(IFLAAttr.IFNAME, name),
+            extra_attrs,
+            _build_linkinfo(kind, info_data),
+        )
+    )
 
-    flags = NLMsgFlags.REQUEST | NLMsgFlags.ACK | NLMsgFlags.EXCL | NLMsgFlags.CREATE
+    # NLM_F_ECHO has the kernel send the new link back, which carries the
+    # assigned ifindex; kernels before 6.3 ignore it for RTM_NEWLINK
+    flags = (
+        NLMsgFlags.REQUEST
+        | NLMsgFlags.ACK
+        | NLMsgFlags.ECHO
+        | NLMsgFlags.EXCL
+        | NLMsgFlags.CREATE
+    )
     msg = pack_nlmsg(RTMType.NEWLINK, flags, ifinfomsg + attrs)
     sock.send(msg)
-    recv_msgs(sock)
+    for _, payload in recv_msgs(sock, accept=_ACCEPT_NEWLINK):
+        if len(payload) >= 16:
+            index: int = _IFINFOMSG_UNSPEC.unpack_from(payload)[0]
+            return index
+    return _resolve_index(name)
 
 
 def _set_link_flags(
@@ -78,9 +185,61 @@ def _set_link_flags(
 ) -> None:
     """Set interface flags via RTM_NEWLINK."""
     index = _resolve_index(name, index)
-
-    # ifinfomsg: family(1) + pad(1) + type(2) + index(4) + flags(4) + change(4)
-    ifinfomsg = struct.pack("BxHiII", AddressFamily.UNSPEC, 0, index, flags, change)
-    msg = pack_nlmsg(RTMType.NEWLINK, NLMsgFlags.REQUEST | NLMsgFlags.ACK, ifinfomsg)
-    sock.send(msg)
+    sock.send(_link_msg(RTMType.NEWLINK, index, flags, change))
     recv_msgs(sock)
+
+
+def _link_msg(msg_type: int, index: int, flags: int = 0, change: int = 0) -> bytes:
+    """Build an attribute-less link request for `index`."""
+    return _LINK_MSG.pack(
+        _LINK_MSG.size,
+        msg_type,
+        NLMsgFlags.REQUEST | NLMsgFlags.ACK,
+        1,
+        0,
+        AddressFamily.UNSPEC,
+        0,
+        index,
+        flags,
+        change,
+    )
+
+
+def _link_u32_msg(index: int, attr_type: int, value: int) -> bytes:
+    """Build an RTM_NEWLINK request carrying a single u32 attribute."""
+    return _LINK_U32_MSG.pack(
+        _LINK_U32_MSG.size,
+        RTMType.NEWLINK,
+        NLMsgFlags.REQUEST | NLMsgFlags.ACK,
+        1,
+        0,
+        index,
+        8,
+        attr_type,
+        value,
+    )
+
+
+def _link_attrs_msg(index: int, *attrs: bytes) -> bytes:
+    """Build an acked RTM_NEWLINK request for `index` carrying `attrs`.
+
+    The headers are packed in one call and joined with the attributes,
+    so the message is assembled with a single copy of each part.
+    """
+    nlmsg_len = _LINK_HDR.size + sum(map(len, attrs))
+    hdr = _LINK_HDR.pack(
+        nlmsg_len, RTMType.NEWLINK, NLMsgFlags.REQUEST | NLMsgFlags.ACK, 1, 0, index
+    )
+    return b"".join((hdr, *attrs))
+
+
+def _set_master_msg(index: int, master_index: int) -> bytes:
+    """Build an RTM_NEWLINK request setting IFLA_MASTER (0 to release)."""
+    return _link_u32_msg(index, IFLAAttr.MASTER, master_index)
+
+
+def _batch_set_master(
+    sock: socket.socket, members: list[int], master_index: int
+) -> None:
+    """Enslave several interfaces to a master with one batched netlink send."""
+    send_batch(sock, [_set_master_msg(index, master_index) for index in members])
@@ -12,10 +12,9 @@ from truenas_pynetif.address.constants import (
     RTMType,
     RTScope,
 )
-from truenas_pynetif.address.get_ipaddresses import get_link_addresses
+from truenas_pynetif.address.get_ipaddresses import _IFADDRMSG, get_link_addresses
 from truenas_pynetif.netlink._core import (
     NLMsgFlags,
-    pack_nlattr,
     pack_nlmsg,
     recv_msgs,
 )
@@ -27,28 +26,89 @@ from truenas_pynetif.netlink._exceptions import (
 
 __all__ = ("add_address", "remove_address", "replace_address", "flush_addresses")
 
+# IFA_LOCAL + IFA_ADDRESS (+ IFA_BROADCAST) attributes, already 4-byte aligned
+_IFA_ATTRS_V4 = struct.Struct("HH4sHH4s")
+_IFA_ATTRS_V4_BCAST = struct.Struct("HH4sHH4sHH4s")
+_IFA_ATTRS_V6 = struct.Struct("HH16sHH16s")
+
 
 def _parse_address_params(
     address: str, name: str | None, index: int | None
-) -> tuple[int, int, ipaddress.IPv4Address | ipaddress.IPv6Address]:
+) -> tuple[int, int, bytes]:
     """Parse and validate address parameters.
 
     Returns:
-        Tuple of (interface_index, address_family, address_object)
+        Tuple of (interface_index, address_family, packed_address)
     """
     ifindex = _resolve_index(name, index)
 
+    try:
+        return ifindex, AddressFamily.INET, socket.inet_pton(socket.AF_INET, address)
+    except OSError:
+        pass
+    try:
+        return ifindex, AddressFamily.INET6, socket.inet_pton(socket.AF_INET6, address)
+    except OSError:
+        pass
+    # inet_pton() rejects scoped IPv6 literals such as "fe80::1%eth0"
     try:
         addr_obj = ipaddress.ip_address(address)
     except ValueError as e:
         raise ValueError(f"Invalid IP address: {address}") from e
+    if addr_obj.version == 4:
+        return ifindex, AddressFamily.INET, addr_obj.packed
+    return ifindex, AddressFamily.INET6, addr_obj.packed
+
+
+def _ipv4_broadcast(addr_bytes: bytes, prefixlen: int, broadcast: str | None) -> bytes:
+    """Return the packed IPv4 broadcast address, calculating it if not provided."""
+    if broadcast is not None:
+        try:
+            return socket.inet_pton(socket.AF_INET, broadcast)
+        except OSError as e:
+            raise ValueError(f"Invalid broadcast address: {broadcast}") from e
+    if not 0 <= prefixlen <= 32:
+        raise ValueError(f"Invalid prefix length: {prefixlen}")
+    hostmask = 0xFFFFFFFF >> prefixlen
+    return (int.from_bytes(addr_bytes, "big") | hostmask).to_bytes(4, "big")
+
+
+def _pack_addr_attrs(addr_bytes: bytes, bcast_bytes: bytes | None = None) -> bytes:
+    """Pack the IFA_LOCAL/IFA_ADDRESS (and IFA_BROADCAST) attributes."""
+    if bcast_bytes is not None:
+        return _IFA_ATTRS_V4_BCAST.pack(
+            8,
+            IFAAttr.LOCAL,
+            addr_bytes,
+            8,
+            IFAAttr.ADDRESS,
+            addr_bytes,
+            8,
+            IFAAttr.BROADCAST,
+            bcast_bytes,
+        )
+    if len(addr_bytes) == 4:
+        return _IFA_ATTRS_V4.pack(
+            8, IFAAttr.LOCAL, addr_bytes, 8, IFAAttr.ADDRESS, addr_bytes
+        )
+    return _IFA_ATTRS_V6.pack(
+        20, IFAAttr.LOCAL, addr_bytes, 20, IFAAttr.ADDRESS, addr_bytes
+    )
 
-    if isinstance(addr_obj, ipaddress.IPv4Address):
-        family = AddressFamily.INET
-    else:
-        family = AddressFamily.INET6
 
-    return ifindex, family, addr_obj
+def _address_msg(
+    msg_type: int,
+    flags: int,
+    ifindex: int,
+    family: int,
+    prefixlen: int,
+    addr_bytes: bytes,
+    bcast_bytes: bytes | None = None,
+) -> bytes:
+    """Build an RTM_NEWADDR/RTM_DELADDR request."""
+    ifaddrmsg = _IFADDRMSG.pack(family, prefixlen, 0, 0, ifindex)
+    attrs = _pack_addr_attrs(addr_bytes, bcast_bytes)
+    return pack_nlmsg(msg_type, flags, ifaddrmsg + attrs)
 
 
 def add_address(
@@ -70,34 +130,20 @@ def add_address(
         index: Interface index (mutually exclusive with name)
         broadcast: Broadcast address for IPv4 (auto-calculated if None)
     """
-    ifindex, family, addr_obj = _parse_address_params(address, name, index)
-    addr_bytes = addr_obj.packed
-
-    if isinstance(addr_obj, ipaddress.IPv4Address):
-        # Calculate broadcast if not provided
-        if broadcast is None:
-            network = ipaddress.IPv4Network(f"{address}/{prefixlen}", strict=False)
-            bcast_bytes = network.broadcast_address.packed
-        else:
-            bcast_bytes = ipaddress.IPv4Address(broadcast).packed
-    else:
-        bcast_bytes = None
-
-    # Build ifaddrmsg header
-    ifaddrmsg = struct.pack("BBBBI", family, prefixlen, 0, 0, ifindex)
-
-    # Build attributes
-    attrs = b""
-    attrs += pack_nlattr(IFAAttr.LOCAL, addr_bytes)
-    attrs += pack_nlattr(IFAAttr.ADDRESS, addr_bytes)
-    if bcast_bytes:
-        attrs += pack_nlattr(IFAAttr.BROADCAST, bcast_bytes)
-
-    # Send message
-    msg = pack_nlmsg(
+    ifindex, family, addr_bytes = _parse_address_params(address, name, index)
+
+    bcast_bytes = None
+    if family == AddressFamily.INET:
+        bcast_bytes = _ipv4_broadcast(addr_bytes, prefixlen, broadcast)
+
+    msg = _address_msg(
         RTMType.NEWADDR,
         NLMsgFlags.REQUEST | NLMsgFlags.ACK | NLMsgFlags.CREATE | NLMsgFlags.EXCL,
-        ifaddrmsg + attrs,
+        ifindex,
+        family,
+        prefixlen,
+        addr_bytes,
+        bcast_bytes,
     )
     sock.send(msg)
     try:
@@ -125,22 +171,15 @@ def remove_address(
         name: Interface name (mutually exclusive with index)
         index: Interface index (mutually exclusive with name)
     """
-    ifindex, family, addr_obj = _parse_address_params(address, name, index)
-    addr_bytes = addr_obj.packed
-
-    # Build ifaddrmsg header
-    ifaddrmsg = struct.pack("BBBBI", family, prefixlen, 0, 0, ifindex)
-
-    # Build attributes
-    attrs = b""
-    attrs += pack_nlattr(IFAAttr.LOCAL, addr_bytes)
-    attrs += pack_nlattr(IFAAttr.ADDRESS, addr_bytes)
+    ifindex, family, addr_bytes = _parse_address_params(address, name, index)
 
-    # Send message
-    msg = pack_nlmsg(
+    msg = _address_msg(
         RTMType.DELADDR,
         NLMsgFlags.REQUEST | NLMsgFlags.ACK,
-        ifaddrmsg + attrs,
+        ifindex,
+        family,
+        prefixlen,
+        addr_bytes,
     )
     sock.send(msg)
     try:
@@ -175,33 +214,20 @@ def replace_address(
         index: Interface index (mutually exclusive with name)
         broadcast: Broadcast address for IPv4 (auto-calculated if None)
     """
-    ifindex, family, addr_obj = _parse_address_params(address, name, index)
-    addr_bytes = addr_obj.packed
-
-    if isinstance(addr_obj, ipaddress.IPv4Address):
-        if broadcast is None:
-            network = ipaddress.IPv4Network(f"{address}/{prefixlen}", strict=False)
-            bcast_bytes = network.broadcast_address.packed
-        else:
-            bcast_bytes = ipaddress.IPv4Address(broadcast).packed
-    else:
-        bcast_bytes = None
-
-    # Build ifaddrmsg header
-    ifaddrmsg = struct.pack("BBBBI", family, prefixlen, 0, 0, ifindex)
-
-    # Build attributes
-    attrs = b""
-    attrs += pack_nlattr(IFAAttr.LOCAL, addr_bytes)
-    attrs += pack_nlattr(IFAAttr.ADDRESS, addr_bytes)
-    if bcast_bytes:
-        attrs += pack_nlattr(IFAAttr.BROADCAST, bcast_bytes)
-
-    # Send message with REPLACE flag
-    msg = pack_nlmsg(
+    ifindex, family, addr_bytes = _parse_address_params(address, name, index)
+
+    bcast_bytes = None
+    if family == AddressFamily.INET:
+        bcast_bytes = _ipv4_broadcast(addr_bytes, prefixlen, broadcast)
+
+    msg = _address_msg(
         RTMType.NEWADDR,
         NLMsgFlags.REQUEST | NLMsgFlags.ACK | NLMsgFlags.REPLACE,
-        ifaddrmsg + attrs,
+        ifindex,
+        family,
+        prefixlen,
+        addr_bytes,
+        bcast_bytes,
     )
     sock.send(msg)
     recv_msgs(sock)
@@ -1,25 +1,24 @@
 import errno
 import socket
-import struct
 
-from truenas_pynetif.address._link_helpers import _create_link, _resolve_index
+from truenas_pynetif.address._link_helpers import (
+    _batch_set_master,
+    _create_link,
+    _link_attrs_msg,
+    _linkinfo_option_prefix,
+    _resolve_index,
+    _resolve_indices_bulk,
+    _set_master_msg,
+)
 from truenas_pynetif.address.constants import (
-    AddressFamily,
     BondLacpRate,
     BondMode,
     BondXmitHashPolicy,
-    IFLAAttr,
     IFLABondAttr,
-    IFLAInfoAttr,
-    RTMType,
 )
 from truenas_pynetif.netlink._core import (
-    NLMsgFlags,
-    pack_nlattr_nested,
-    pack_nlattr_str,
     pack_nlattr_u8,
     pack_nlattr_u32,
-    pack_nlmsg,
     recv_msgs,
 )
 from truenas_pynetif.netlink._exceptions import BondHasMembers, NetlinkError
@@ -41,6 +40,18 @@ __all__ = (
     "BondXmitHashPolicy",
 )
 
+_BOND_OPTION_PREFIX = _linkinfo_option_prefix("bond")
+
+
+def _bond_option_u8(attr_type: int, value: int) -> bytes:
+    """Pack IFLA_LINKINFO carrying a single u8 bond option."""
+    return _BOND_OPTION_PREFIX + pack_nlattr_u8(attr_type, value)
+
+
+def _bond_option_u32(attr_type: int, value: int) -> bytes:
+    """Pack IFLA_LINKINFO carrying a single u32 bond option."""
+    return _BOND_OPTION_PREFIX + pack_nlattr_u32(attr_type, value)
+
 
 def create_bond(
     sock: socket.socket,
@@ -75,37 +86,52 @@ def create_bond(
         miimon: MII link monitoring interval in milliseconds (default 100ms)
         primary: Primary interface name for ACTIVE_BACKUP mode (mutually exclusive with primary_index)
         primary_index: Primary interface index for ACTIVE_BACKUP mode (mutually exclusive with primary)
+
+    Note:
+        Members are attached with one batched request after the bond is
+        created. If one of them fails, the others are still attached and the
+        raised NetlinkError's `batch_index` is the position of the failing
+        member; the primary is only set once every member is attached.
     """
     if members and members_index:
         raise ValueError("members and members_index are mutually exclusive")
     if primary and primary_index:
         raise ValueError("primary and primary_index are mutually exclusive")
 
-    info_data = b""
+    parts = []
     if mode is not None:
-        info_data += pack_nlattr_u8(IFLABondAttr.MODE, mode)
+        parts.append(pack_nlattr_u8(IFLABondAttr.MODE, mode))
     if xmit_hash_policy is not None:
-        info_data += pack_nlattr_u8(IFLABondAttr.XMIT_HASH_POLICY, xmit_hash_policy)
+        parts.append(pack_nlattr_u8(IFLABondAttr.XMIT_HASH_POLICY, xmit_hash_policy))
     if lacpdu_rate is not None:
-        info_data += pack_nlattr_u8(IFLABondAttr.AD_LACP_RATE, lacpdu_rate)
+        parts.append(pack_nlattr_u8(IFLABondAttr.AD_LACP_RATE, lacpdu_rate))
     if miimon is not None:
-        info_data += pack_nlattr_u32(IFLABondAttr.MIIMON, miimon)
+        parts.append(pack_nlattr_u32(IFLABondAttr.MIIMON, miimon))
+    info_data = b"".join(parts)
 
-    _create_link(sock, name, "bond", info_data=info_data)
+    bond_index = _create_link(sock, name, "bond", info_data=info_data)
 
-    # Add members after bond is created
-    if members or members_index:
-        bond_index = socket.if_nametoindex(name)
+    lookup = list(members or [])
+    if primary:
+        lookup.append(primary)
+    if lookup:
+        name2idx = _resolve_indices_bulk(sock, lookup)
         if members:
-            for member in members:
-                bond_add_member(sock, member, master_index=bond_index)
-        elif members_index:
-            for idx in members_index:
-                bond_add_member(sock, index=idx, master_index=bond_index)
+            members_index = [name2idx[member] for member in members]
+        if primary:
+            primary_index = name2idx[primary]
+
+    if members_index:
+        _batch_set_master(sock, members_index, bond_index)
+    if primary_index:
+        sock.send(_bond_primary_msg(bond_index, primary_index))
+        recv_msgs(sock)
+
 
-    # Set primary after members are added
-    if primary or primary_index:
-        set_bond_primary(sock, primary, primary_index=primary_index, name=name)
+def _bond_primary_msg(bond_index: int, primary_index: int) -> bytes:
+    """Build an RTM_NEWLINK request setting IFLA_BOND_PRIMARY."""
+    attrs = _bond_option_u32(IFLABondAttr.PRIMARY, primary_index)
+    return _link_attrs_msg(bond_index, attrs)
 
 
 def set_bond_primary(
@@ -127,17 +153,7 @@ def set_bond_primary(
     """
     bond_index = _resolve_index(name, index)
     primary_index = _resolve_index(primary, primary_index)
-    ifinfomsg = struct.pack("BxHiII", AddressFamily.UNSPEC, 0, bond_index, 0, 0)
-
-    info_data = pack_nlattr_u32(IFLABondAttr.PRIMARY, primary_index)
-    linkinfo = pack_nlattr_str(IFLAInfoAttr.KIND, "bond")
-    linkinfo += pack_nlattr_nested(IFLAInfoAttr.DATA, info_data)
-    attrs = pack_nlattr_nested(IFLAAttr.LINKINFO, linkinfo)
-
-    msg = pack_nlmsg(
-        RTMType.NEWLINK, NLMsgFlags.REQUEST | NLMsgFlags.ACK, ifinfomsg + attrs
-    )
-    sock.send(msg)
+    sock.send(_bond_primary_msg(bond_index, primary_index))
     recv_msgs(sock)
 
 
@@ -160,12 +176,7 @@ def bond_add_member(
     """
     index = _resolve_index(name, index)
     master_index = _resolve_index(master, master_index)
-    ifinfomsg = struct.pack("BxHiII", AddressFamily.UNSPEC, 0, index, 0, 0)
-    attrs = pack_nlattr_u32(IFLAAttr.MASTER, master_index)
-    msg = pack_nlmsg(
-        RTMType.NEWLINK, NLMsgFlags.REQUEST | NLMsgFlags.ACK, ifinfomsg + attrs
-    )
-    sock.send(msg)
+    sock.send(_set_master_msg(index, master_index))
     recv_msgs(sock)
 
 
@@ -183,12 +194,7 @@ def bond_rem_member(
         index: Index of interface to remove (mutually exclusive with name)
     """
     index = _resolve_index(name, index)
-    ifinfomsg = struct.pack("BxHiII", AddressFamily.UNSPEC, 0, index, 0, 0)
-    attrs = pack_nlattr_u32(IFLAAttr.MASTER, 0)
-    msg = pack_nlmsg(
-        RTMType.NEWLINK, NLMsgFlags.REQUEST | NLMsgFlags.ACK, ifinfomsg + attrs
-    )
-    sock.send(msg)
+    sock.send(_set_master_msg(index, 0))
     recv_msgs(sock)
 
 
@@ -239,16 +245,8 @@ def set_bond_mode(
         BondHasMembers: If the bond has members attached.
     """
     index = _resolve_index(name, index)
-    ifinfomsg = struct.pack("BxHiII", AddressFamily.UNSPEC, 0, index, 0, 0)
-
-    info_data = pack_nlattr_u8(IFLABondAttr.MODE, mode)
-    linkinfo = pack_nlattr_str(IFLAInfoAttr.KIND, "bond")
-    linkinfo += pack_nlattr_nested(IFLAInfoAttr.DATA, info_data)
-    attrs = pack_nlattr_nested(IFLAAttr.LINKINFO, linkinfo)
-
-    msg = pack_nlmsg(
-        RTMType.NEWLINK, NLMsgFlags.REQUEST | NLMsgFlags.ACK, ifinfomsg + attrs
-    )
+    attrs = _bond_option_u8(IFLABondAttr.MODE, mode)
+    msg = _link_attrs_msg(index, attrs)
     sock.send(msg)
     try:
         recv_msgs(sock)
@@ -277,16 +275,8 @@ def set_bond_miimon(
         index: Bond interface index (mutually exclusive with name)
     """
     index = _resolve_index(name, index)
-    ifinfomsg = struct.pack("BxHiII", AddressFamily.UNSPEC, 0, index, 0, 0)
-
-    info_data = pack_nlattr_u32(IFLABondAttr.MIIMON, miimon)
-    linkinfo = pack_nlattr_str(IFLAInfoAttr.KIND, "bond")
-    linkinfo += pack_nlattr_nested(IFLAInfoAttr.DATA, info_data)
-    attrs = pack_nlattr_nested(IFLAAttr.LINKINFO, linkinfo)
-
-    msg = pack_nlmsg(
-        RTMType.NEWLINK, NLMsgFlags.REQUEST | NLMsgFlags.ACK, ifinfomsg + attrs
-    )
+    attrs = _bond_option_u32(IFLABondAttr.MIIMON, miimon)
+    msg = _link_attrs_msg(index, attrs)
     sock.send(msg)
     recv_msgs(sock)
 
@@ -307,16 +297,8 @@ def set_bond_xmit_hash_policy(
         index: Bond interface index (mutually exclusive with name)
     """
     index = _resolve_index(name, index)
-    ifinfomsg = struct.pack("BxHiII", AddressFamily.UNSPEC, 0, index, 0, 0)
-
-    info_data = pack_nlattr_u8(IFLABondAttr.XMIT_HASH_POLICY, xmit_hash_policy)
-    linkinfo = pack_nlattr_str(IFLAInfoAttr.KIND, "bond")
-    linkinfo += pack_nlattr_nested(IFLAInfoAttr.DATA, info_data)
-    attrs = pack_nlattr_nested(IFLAAttr.LINKINFO, linkinfo)
-
-    msg = pack_nlmsg(
-        RTMType.NEWLINK, NLMsgFlags.REQUEST | NLMsgFlags.ACK, ifinfomsg + attrs
-    )
+    attrs = _bond_option_u8(IFLABondAttr.XMIT_HASH_POLICY, xmit_hash_policy)
+    msg = _link_attrs_msg(index, attrs)
     sock.send(msg)
     recv_msgs(sock)
 
@@ -337,15 +319,7 @@ def set_lacpdu_rate(
         index: Bond interface index (mutually exclusive with name)
     """
     index = _resolve_index(name, index)
-    ifinfomsg = struct.pack("BxHiII", AddressFamily.UNSPEC, 0, index, 0, 0)
-
-    info_data = pack_nlattr_u8(IFLABondAttr.AD_LACP_RATE, lacpdu_rate)
-    linkinfo = pack_nlattr_str(IFLAInfoAttr.KIND, "bond")
-    linkinfo += pack_nlattr_nested(IFLAInfoAttr.DATA, info_data)
-    attrs = pack_nlattr_nested(IFLAAttr.LINKINFO, linkinfo)
-
-    msg = pack_nlmsg(
-        RTMType.NEWLINK, NLMsgFlags.REQUEST | NLMsgFlags.ACK, ifinfomsg + attrs
-    )
+    attrs = _bond_option_u8(IFLABondAttr.AD_LACP_RATE, lacpdu_rate)
+    msg = _link_attrs_msg(index, attrs)
     sock.send(msg)
     recv_msgs(sock)
@@ -1,25 +1,28 @@
 import socket
-import struct
 
-from truenas_pynetif.address._link_helpers import _create_link, _resolve_index
+from truenas_pynetif.address._link_helpers import (
+    _batch_set_master,
+    _create_link,
+    _link_attrs_msg,
+    _linkinfo_option_prefix,
+    _resolve_index,
+    _resolve_indices_bulk,
+    _set_master_msg,
+)
 from truenas_pynetif.netlink.dataclass_types import LinkInfo
 from truenas_pynetif.address.constants import (
-    AddressFamily,
     IFLAAttr,
     IFLABridgeAttr,
     IFLABrPortAttr,
     IFLAInfoAttr,
-    RTMType,
 )
 from truenas_pynetif.netlink._core import (
-    NLMsgFlags,
     pack_nlattr,
     pack_nlattr_nested,
     pack_nlattr_str,
     pack_nlattr_u8,
     pack_nlattr_u16,
     pack_nlattr_u32,
-    pack_nlmsg,
     recv_msgs,
 )
 
@@ -33,6 +36,18 @@ __all__ = (
     "set_bridge_stp",
 )
 
+_BRIDGE_OPTION_PREFIX = _linkinfo_option_prefix("bridge")
+
+
+def _bridge_option_u16(attr_type: int, value: int) -> bytes:
+    """Pack IFLA_LINKINFO carrying a single u16 bridge option."""
+    return _BRIDGE_OPTION_PREFIX + pack_nlattr_u16(attr_type, value)
+
+
+def _bridge_option_u32(attr_type: int, value: int) -> bytes:
+    """Pack IFLA_LINKINFO carrying a single u32 bridge option."""
+    return _BRIDGE_OPTION_PREFIX + pack_nlattr_u32(attr_type, value)
+
 
 def create_bridge(
     sock: socket.socket,
@@ -52,26 +67,30 @@ def create_bridge(
         members_index: List of interface indexes to add as bridge members (mutually exclusive with members)
         stp: Enable or disable Spanning Tree Protocol
         priority: Bridge priority for STP (0-65535, lower = higher priority, default 32768)
+
+    Note:
+        Members are attached with one batched request after the bridge is
+        created. If one of them fails, the others are still attached and the
+        raised NetlinkError's `batch_index` is the position of the failing
+        member.
     """
     if members and members_index:
         raise ValueError("members and members_index are mutually exclusive")
 
-    info_data = b""
+    parts = []
     if stp is not None:
-        info_data += pack_nlattr_u32(IFLABridgeAttr.STP_STATE, 1 if stp else 0)
+        parts.append(pack_nlattr_u32(IFLABridgeAttr.STP_STATE, 1 if stp else 0))
     if priority is not None:
-        info_data += pack_nlattr_u16(IFLABridgeAttr.PRIORITY, priority)
+        parts.append(pack_nlattr_u16(IFLABridgeAttr.PRIORITY, priority))
+    info_data = b"".join(parts)
 
-    _create_link(sock, name, "bridge", info_data=info_data)
+    bridge_index = _create_link(sock, name, "bridge", info_data=info_data)
 
-    if members or members_index:
-        bridge_index = socket.if_nametoindex(name)
-        if members:
-            for member in members:
-                bridge_add_member(sock, member, master_index=bridge_index)
-        elif members_index:
-            for idx in members_index:
-                bridge_add_member(sock, index=idx, master_index=bridge_index)
+    if members:
+        name2idx = _resolve_indices_bulk(sock, members)
+        members_index = [name2idx[member] for member in members]
+    if members_index:
+        _batch_set_master(sock, members_index, bridge_index)
 
 
 def get_bridge_members(
@@ -117,12 +136,7 @@ def bridge_add_member(
     """
     index = _resolve_index(name, index)
     master_index = _resolve_index(master, master_index)
-    ifinfomsg = struct.pack("BxHiII", AddressFamily.UNSPEC, 0, index, 0, 0)
-    attrs = pack_nlattr_u32(IFLAAttr.MASTER, master_index)
-    msg = pack_nlmsg(
-        RTMType.NEWLINK, NLMsgFlags.REQUEST | NLMsgFlags.ACK, ifinfomsg + attrs
-    )
-    sock.send(msg)
+    sock.send(_set_master_msg(index, master_index))
     recv_msgs(sock)
 
 
@@ -140,12 +154,7 @@ def bridge_rem_member(
         index: Index of interface to remove (mutually exclusive with name)
     """
     index = _resolve_index(name, index)
-    ifinfomsg = struct.pack("BxHiII", AddressFamily.UNSPEC, 0, index, 0, 0)
-    attrs = pack_nlattr_u32(IFLAAttr.MASTER, 0)
-    msg = pack_nlmsg(
-        RTMType.NEWLINK, NLMsgFlags.REQUEST | NLMsgFlags.ACK, ifinfomsg + attrs
-    )
-    sock.send(msg)
+    sock.send(_set_master_msg(index, 0))
     recv_msgs(sock)
 
 
@@ -165,17 +174,12 @@ def set_bridge_learning(
         index: Bridge port interface index (mutually exclusive with name)
     """
     index = _resolve_index(name, index)
-    ifinfomsg = struct.pack("BxHiII", AddressFamily.UNSPEC, 0, index, 0, 0)
-
     # Bridge port attributes nested in LINKINFO/SLAVE_KIND/SLAVE_DATA
     slave_data = pack_nlattr_u8(IFLABrPortAttr.LEARNING, 1 if enable else 0)
     linkinfo = pack_nlattr_str(IFLAInfoAttr.SLAVE_KIND, "bridge")
     linkinfo += pack_nlattr_nested(IFLAInfoAttr.SLAVE_DATA, slave_data)
     attrs = pack_nlattr_nested(IFLAAttr.LINKINFO, linkinfo)
-
-    msg = pack_nlmsg(
-        RTMType.NEWLINK, NLMsgFlags.REQUEST | NLMsgFlags.ACK, ifinfomsg + attrs
-    )
+    msg = _link_attrs_msg(index, attrs)
     sock.send(msg)
     recv_msgs(sock)
 
@@ -196,16 +200,8 @@ def set_bridge_priority(
         index: Bridge interface index (mutually exclusive with name)
     """
     index = _resolve_index(name, index)
-    ifinfomsg = struct.pack("BxHiII", AddressFamily.UNSPEC, 0, index, 0, 0)
-
-    info_data = pack_nlattr_u16(IFLABridgeAttr.PRIORITY, priority)
-    linkinfo = pack_nlattr_str(IFLAInfoAttr.KIND, "bridge")
-    linkinfo += pack_nlattr_nested(IFLAInfoAttr.DATA, info_data)
-    attrs = pack_nlattr_nested(IFLAAttr.LINKINFO, linkinfo)
-
-    msg = pack_nlmsg(
-        RTMType.NEWLINK, NLMsgFlags.REQUEST | NLMsgFlags.ACK, ifinfomsg + attrs
-    )
+    attrs = _bridge_option_u16(IFLABridgeAttr.PRIORITY, priority)
+    msg = _link_attrs_msg(index, attrs)
     sock.send(msg)
     recv_msgs(sock)
 
@@ -226,15 +222,7 @@ def set_bridge_stp(
         index: Bridge interface index (mutually exclusive with name)
     """
     index = _resolve_index(name, index)
-    ifinfomsg = struct.pack("BxHiII", AddressFamily.UNSPEC, 0, index, 0, 0)
-
-    info_data = pack_nlattr_u32(IFLABridgeAttr.STP_STATE, 1 if stp else 0)
-    linkinfo = pack_nlattr_str(IFLAInfoAttr.KIND, "bridge")
-    linkinfo += pack_nlattr_nested(IFLAInfoAttr.DATA, info_data)
-    attrs = pack_nlattr_nested(IFLAAttr.LINKINFO, linkinfo)
-
-    msg = pack_nlmsg(
-        RTMType.NEWLINK, NLMsgFlags.REQUEST | NLMsgFlags.ACK, ifinfomsg + attrs
-    )
+    attrs = _bridge_option_u32(IFLABridgeAttr.STP_STATE, 1 if stp else 0)
+    msg = _link_attrs_msg(index, attrs)
     sock.send(msg)
     recv_msgs(sock)
@@ -8,6 +8,7 @@ SOL_NETLINK = 270
 
 
 class NetlinkSockOpt(IntEnum):
+    CAP_ACK = 10
     GET_STRICT_CHK = 12
 
 
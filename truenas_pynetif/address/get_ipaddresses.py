@@ -14,13 +14,36 @@ from truenas_pynetif.netlink._core import (
     NLMsgFlags,
     format_address,
     pack_nlmsg,
-    parse_attrs,
+    parse_attrs_into,
     recv_msgs,
     resolve_ifname,
 )
 
 __all__ = ("get_addresses", "get_link_addresses")
 
+# ifaddrmsg: family(1) + prefixlen(1) + flags(1) + scope(1) + index(4)
+_IFADDRMSG = struct.Struct("BBBBI")
+# ifa_cacheinfo: ifa_prefered(4) + ifa_valid(4), cstamp/tstamp unused
+_CACHEINFO = struct.Struct("II")
+_GETADDR_DUMP = pack_nlmsg(
+    RTMType.GETADDR,
+    NLMsgFlags.REQUEST | NLMsgFlags.DUMP,
+    _IFADDRMSG.pack(AddressFamily.UNSPEC, 0, 0, 0, 0),
+)
+# Enough slots for every IFA_* attribute type (highest is IFA_PROTO = 11)
+_IFA_SLOTS = 16
+
+# Plain int copies of the enum members used for every record; indexing and
+# comparing with IntEnum members is several times slower than with ints
+_RTM_NEWADDR = int(RTMType.NEWADDR)
+_IFA_ADDRESS = int(IFAAttr.ADDRESS)
+_IFA_LOCAL = int(IFAAttr.LOCAL)
+_IFA_LABEL = int(IFAAttr.LABEL)
+_IFA_BROADCAST = int(IFAAttr.BROADCAST)
+_IFA_CACHEINFO = int(IFAAttr.CACHEINFO)
+_IFA_PROTO = int(IFAAttr.PROTO)
+_ACCEPT_NEWADDR = frozenset((_RTM_NEWADDR,))
+
 
 def _parse_address_payload(
     payload: bytes, ifname_cache: dict[int, str | None] | None = None
@@ -30,32 +53,35 @@ def _parse_address_payload(
         return None
 
     # Parse ifaddrmsg header
-    ifa_family, ifa_prefixlen, ifa_flags, ifa_scope, ifa_index = struct.unpack_from(
-        "BBBBI", payload, 0
+    ifa_family, ifa_prefixlen, ifa_flags, ifa_scope, ifa_index = (
+        _IFADDRMSG.unpack_from(payload, 0)
     )
     # Parse attributes after ifaddrmsg (8 bytes)
-    attrs = parse_attrs(payload, 8)
-
-    # Get address - prefer IFA_ADDRESS, fall back to IFA_LOCAL
-    address = None
-    if IFAAttr.ADDRESS in attrs:
-        address = format_address(ifa_family, attrs[IFAAttr.ADDRESS])
-    elif IFAAttr.LOCAL in attrs:
-        address = format_address(ifa_family, attrs[IFAAttr.LOCAL])
+    attrs: list[bytes | None] = [None] * _IFA_SLOTS
+    parse_attrs_into(payload, 8, attrs)
+
+    local = None
+    if (raw_local := attrs[_IFA_LOCAL]) is not None:
+        local = format_address(ifa_family, raw_local)
+
+    # Get address - prefer IFA_ADDRESS, fall back to IFA_LOCAL. Both carry
+    # the same bytes on non point-to-point IPv4 links, so format only once.
+    raw = attrs[_IFA_ADDRESS]
+    if raw is None or raw == raw_local:
+        address = local
+    else:
+        address = format_address(ifa_family, raw)
     if not address:
         return None
 
-    local = None
     broadcast = None
     label = None
     ifname = None
 
-    if IFAAttr.LOCAL in attrs:
-        local = format_address(ifa_family, attrs[IFAAttr.LOCAL])
-    if IFAAttr.BROADCAST in attrs:
-        broadcast = format_address(ifa_family, attrs[IFAAttr.BROADCAST])
-    if IFAAttr.LABEL in attrs:
-        label = attrs[IFAAttr.LABEL].rstrip(b"\x00").decode("utf-8", errors="replace")
+    if (raw := attrs[_IFA_BROADCAST]) is not None:
+        broadcast = format_address(ifa_family, raw)
+    if (raw := attrs[_IFA_LABEL]) is not None:
+        label = raw.rstrip(b"\x00").decode("utf-8", errors="replace")
 
     if ifname_cache is not None:
         ifname = resolve_ifname(ifa_index, ifname_cache)
@@ -65,11 +91,11 @@ def _parse_address_payload(
     valid_lft = None
     preferred_lft = None
 
-    if IFAAttr.PROTO in attrs:
-        proto = attrs[IFAAttr.PROTO][0]
+    if (raw := attrs[_IFA_PROTO]) is not None:
+        proto = raw[0]
 
-    if IFAAttr.CACHEINFO in attrs and len(attrs[IFAAttr.CACHEINFO]) >= 8:
-        ifa_prefered, ifa_valid = struct.unpack("II", attrs[IFAAttr.CACHEINFO][:8])
+    if (raw := attrs[_IFA_CACHEINFO]) is not None and len(raw) >= 8:
+        ifa_prefered, ifa_valid = _CACHEINFO.unpack_from(raw)
         preferred_lft = None if ifa_prefered == 0xFFFFFFFF else ifa_prefered
         valid_lft = None if ifa_valid == 0xFFFFFFFF else ifa_valid
 
@@ -90,17 +116,28 @@ def _parse_address_payload(
     )
 
 
-def get_addresses(sock: socket.socket) -> list[AddressInfo]:
-    """Get all addresses for all interfaces."""
-    ifaddrmsg = struct.pack("BBBBI", AddressFamily.UNSPEC, 0, 0, 0, 0)
-    msg = pack_nlmsg(RTMType.GETADDR, NLMsgFlags.REQUEST | NLMsgFlags.DUMP, ifaddrmsg)
-    sock.send(msg)
+def get_addresses(
+    sock: socket.socket,
+    *,
+    resolve_names: bool = True,
+    ifnames: dict[int, str] | None = None,
+) -> list[AddressInfo]:
+    """Get all addresses for all interfaces.
+
+    Args:
+        sock: Netlink socket from netlink_route()
+        resolve_names: Fill in `ifname` for each address; when False it is
+            left as None and no name lookups are made
+        ifnames: Known index to name mapping (e.g. from get_links()) used
+            before falling back to per-index lookups
+    """
+    sock.send(_GETADDR_DUMP)
 
     addresses: list[AddressInfo] = []
-    ifname_cache: dict[int, str | None] = {}
-    for msg_type, payload in recv_msgs(sock):
-        if msg_type != RTMType.NEWADDR:
-            continue
+    ifname_cache: dict[int, str | None] | None = None
+    if resolve_names:
+        ifname_cache = dict(ifnames) if ifnames else {}
+    for _, payload in recv_msgs(sock, accept=_ACCEPT_NEWADDR):
         if addr_info := _parse_address_payload(payload, ifname_cache):
             addresses.append(addr_info)
 
@@ -125,7 +162,7 @@ def get_link_addresses(
     # Enable strict checking so kernel filters by interface index
     sock.setsockopt(SOL_NETLINK, NetlinkSockOpt.GET_STRICT_CHK, 1)
     try:
-        ifaddrmsg = struct.pack("BBBBI", AddressFamily.UNSPEC, 0, 0, 0, index)
+        ifaddrmsg = _IFADDRMSG.pack(AddressFamily.UNSPEC, 0, 0, 0, index)
         msg = pack_nlmsg(
             RTMType.GETADDR, NLMsgFlags.REQUEST | NLMsgFlags.DUMP, ifaddrmsg
         )
@@ -135,9 +172,7 @@ def get_link_addresses(
         if name is not None:
             ifname_cache[index] = name
         addresses: list[AddressInfo] = []
-        for msg_type, payload in recv_msgs(sock):
-            if msg_type != RTMType.NEWADDR:
-                continue
+        for _, payload in recv_msgs(sock, accept=_ACCEPT_NEWADDR):
             if addr_info := _parse_address_payload(payload, ifname_cache):
                 addresses.append(addr_info)
 
@@ -1,5 +1,5 @@
 import socket
-import struct
+from typing import Any, Callable
 
 from truenas_pynetif.address.constants import (
     AddressFamily,
@@ -13,204 +13,183 @@ from truenas_pynetif.address.constants import (
 )
 from truenas_pynetif.netlink import DeviceNotFound, LinkInfo
 from truenas_pynetif.netlink._core import (
+    _ACCEPT_NEWLINK,
+    _IFINFOMSG,
+    _IFLA_IFNAME,
+    _NLATTR_HDR,
+    _U16,
+    _U32,
     NLMsgFlags,
+    pack_nlattr_str,
     pack_nlattr_u32,
     pack_nlmsg,
     parse_attrs,
+    parse_attrs_into,
     recv_msgs,
 )
 
 __all__ = ("get_links", "get_link", "link_exists")
 
 
+_IFNAMSIZ = 16
+# Plain int copies of the enum members used for every link; hashing,
+# comparing and indexing with IntEnum members is slower than with ints
+_IFLA_LINK = int(IFLAAttr.LINK)
+_IFLA_LINKINFO = int(IFLAAttr.LINKINFO)
+_IFLA_PROP_LIST = int(IFLAAttr.PROP_LIST)
+_IFLA_ALT_IFNAME = int(IFLAAttr.ALT_IFNAME)
+_IFLA_INFO_KIND = int(IFLAInfoAttr.KIND)
+_IFLA_INFO_DATA = int(IFLAInfoAttr.DATA)
+# Full link dump; IFLA_EXT_MASK skips stats. VF info is not requested since
+# nothing here parses it and the kernel fills it in per VF on every dump
+_GETLINK_DUMP = pack_nlmsg(
+    RTMType.GETLINK,
+    NLMsgFlags.REQUEST | NLMsgFlags.DUMP,
+    _IFINFOMSG.pack(AddressFamily.UNSPEC, 0, 0, 0, 0)
+    + pack_nlattr_u32(IFLAAttr.EXT_MASK, RTEXTFilter.SKIP_STATS),
+)
+
+
+def _u8(data: bytes) -> int:
+    return data[0]
+
+
+def _u16(data: bytes) -> int:
+    value: int = _U16.unpack_from(data)[0]
+    return value
+
+
+def _u32(data: bytes) -> int:
+    value: int = _U32.unpack_from(data)[0]
+    return value
+
+
+def _flag(data: bytes) -> bool:
+    return data[0] != 0
+
+
+def _hwaddr(data: bytes) -> str:
+    return data.hex(":")
+
+
+def _string(data: bytes) -> str:
+    return data.rstrip(b"\x00").decode("utf-8", errors="replace")
+
+
+# Top level IFLA_* attributes that map directly onto a LinkInfo field
+_LINK_ATTR_FIELDS: dict[int, tuple[str, Callable[[bytes], Any]]] = {
+    int(IFLAAttr.MTU): ("mtu", _u32),
+    int(IFLAAttr.OPERSTATE): ("operstate", _u8),
+    int(IFLAAttr.ADDRESS): ("address", _hwaddr),
+    int(IFLAAttr.PERM_ADDRESS): ("perm_address", _hwaddr),
+    int(IFLAAttr.BROADCAST): ("broadcast", _hwaddr),
+    int(IFLAAttr.TXQLEN): ("txqlen", _u32),
+    int(IFLAAttr.MIN_MTU): ("min_mtu", _u32),
+    int(IFLAAttr.MAX_MTU): ("max_mtu", _u32),
+    int(IFLAAttr.CARRIER): ("carrier", _flag),
+    int(IFLAAttr.CARRIER_CHANGES): ("carrier_changes", _u32),
+    int(IFLAAttr.NUM_TX_QUEUES): ("num_tx_queues", _u32),
+    int(IFLAAttr.NUM_RX_QUEUES): ("num_rx_queues", _u32),
+    # Master device index (for bond members, bridge ports, etc.)
+    int(IFLAAttr.MASTER): ("master", _u32),
+    # Parent device info (for USB detection, etc.)
+    int(IFLAAttr.PARENT_DEV_BUS_NAME): ("parentbus", _string),
+    int(IFLAAttr.PARENT_DEV_NAME): ("parentdev", _string),
+}
+
+# IFLA_INFO_DATA attributes that map onto a LinkInfo field, per link kind
+_INFO_DATA_FIELDS: dict[str, dict[int, tuple[str, Callable[[bytes], Any]]]] = {
+    "bond": {
+        int(IFLABondAttr.MODE): ("bond_mode", _u8),
+        int(IFLABondAttr.MIIMON): ("bond_miimon", _u32),
+        int(IFLABondAttr.XMIT_HASH_POLICY): ("bond_xmit_hash_policy", _u8),
+        int(IFLABondAttr.AD_LACP_RATE): ("bond_lacpdu_rate", _u8),
+        int(IFLABondAttr.PRIMARY): ("bond_primary", _u32),
+    },
+    "bridge": {
+        int(IFLABridgeAttr.STP_STATE): ("bridge_stp_state", _u32),
+        int(IFLABridgeAttr.PRIORITY): ("bridge_priority", _u16),
+    },
+    "vlan": {
+        int(IFLAVlanAttr.ID): ("vlan_id", _u16),
+    },
+}
+# Slot list sizes for parse_attrs_into(), just large enough for the types read
+_LINKINFO_SLOTS = _IFLA_INFO_DATA + 1
+_INFO_DATA_SLOTS = {kind: max(table) + 1 for kind, table in _INFO_DATA_FIELDS.items()}
+
+
 def _parse_link_payload(payload: bytes) -> tuple[str, LinkInfo] | None:
     """Parse a NEWLINK payload into (ifname, LinkInfo). Returns None if invalid."""
     if len(payload) < 16:
         return None
 
     # Parse ifinfomsg header
-    ifi_family, ifi_type, ifi_index, ifi_flags, ifi_change = struct.unpack_from(
-        "BxHiII", payload, 0
+    ifi_family, ifi_type, ifi_index, ifi_flags, ifi_change = _IFINFOMSG.unpack_from(
+        payload
     )
     # Parse attributes after ifinfomsg (16 bytes)
     attrs = parse_attrs(payload, 16)
 
     ifname = None
-    if IFLAAttr.IFNAME in attrs:
-        ifname = (
-            attrs[IFLAAttr.IFNAME].rstrip(b"\x00").decode("utf-8", errors="replace")
-        )
+    if (raw := attrs.get(_IFLA_IFNAME)) is not None:
+        ifname = _string(raw)
     if not ifname:
         return None
 
-    # Core fields
-    mtu = 0
-    operstate = 0
-    address = None
-    perm_address = None
-    broadcast = None
-
-    if IFLAAttr.MTU in attrs:
-        mtu = struct.unpack("I", attrs[IFLAAttr.MTU][:4])[0]
-    if IFLAAttr.OPERSTATE in attrs:
-        operstate = attrs[IFLAAttr.OPERSTATE][0]
-    if IFLAAttr.ADDRESS in attrs:
-        address = attrs[IFLAAttr.ADDRESS].hex(":")
-    if IFLAAttr.PERM_ADDRESS in attrs:
-        perm_address = attrs[IFLAAttr.PERM_ADDRESS].hex(":")
-    if IFLAAttr.BROADCAST in attrs:
-        broadcast = attrs[IFLAAttr.BROADCAST].hex(":")
-
-    # Extended fields
-    txqlen = 0
-    min_mtu = 0
-    max_mtu = 0
-    carrier = False
-    carrier_changes = 0
-    num_tx_queues = 1
-    num_rx_queues = 1
-
-    if IFLAAttr.TXQLEN in attrs:
-        txqlen = struct.unpack("I", attrs[IFLAAttr.TXQLEN][:4])[0]
-    if IFLAAttr.MIN_MTU in attrs:
-        min_mtu = struct.unpack("I", attrs[IFLAAttr.MIN_MTU][:4])[0]
-    if IFLAAttr.MAX_MTU in attrs:
-        max_mtu = struct.unpack("I", attrs[IFLAAttr.MAX_MTU][:4])[0]
-    if IFLAAttr.CARRIER in attrs:
-        carrier = attrs[IFLAAttr.CARRIER][0] != 0
-    if IFLAAttr.CARRIER_CHANGES in attrs:
-        carrier_changes = struct.unpack("I", attrs[IFLAAttr.CARRIER_CHANGES][:4])[0]
-    if IFLAAttr.NUM_TX_QUEUES in attrs:
-        num_tx_queues = struct.unpack("I", attrs[IFLAAttr.NUM_TX_QUEUES][:4])[0]
-    if IFLAAttr.NUM_RX_QUEUES in attrs:
-        num_rx_queues = struct.unpack("I", attrs[IFLAAttr.NUM_RX_QUEUES][:4])[0]
-
-    # Master device index (for bond members, bridge ports, etc.)
-    master = None
-    if IFLAAttr.MASTER in attrs:
-        master = struct.unpack("I", attrs[IFLAAttr.MASTER][:4])[0]
-
-    # Parent device info (for USB detection, etc.)
-    parentbus = None
-    parentdev = None
-
-    if IFLAAttr.PARENT_DEV_BUS_NAME in attrs:
-        parentbus = (
-            attrs[IFLAAttr.PARENT_DEV_BUS_NAME]
-            .rstrip(b"\x00")
-            .decode("utf-8", errors="replace")
-        )
-    if IFLAAttr.PARENT_DEV_NAME in attrs:
-        parentdev = (
-            attrs[IFLAAttr.PARENT_DEV_NAME]
-            .rstrip(b"\x00")
-            .decode("utf-8", errors="replace")
-        )
+    # Fields without a LinkInfo default; the rest fall back to theirs
+    fields: dict[str, Any] = {"mtu": 0, "operstate": 0}
+    for attr_type, (field, decode) in _LINK_ATTR_FIELDS.items():
+        if (data := attrs.get(attr_type)) is not None:
+            fields[field] = decode(data)
 
     # Alternate names from IFLA_PROP_LIST
     altnames: list[str] = []
-    if IFLAAttr.PROP_LIST in attrs:
+    if (prop_data := attrs.get(_IFLA_PROP_LIST)) is not None:
+        # Decode straight from a view up to the NUL terminator so each
+        # altname costs one str allocation rather than two bytes copies
+        prop_view = memoryview(prop_data)
         offset = 0
-        prop_data = attrs[IFLAAttr.PROP_LIST]
-        while offset + 4 <= len(prop_data):
-            nla_len, nla_type = struct.unpack_from("HH", prop_data, offset)
+        end = len(prop_data) - 4
+        while offset <= end:
+            nla_len, nla_type = _NLATTR_HDR.unpack_from(prop_data, offset)
             if nla_len < 4:
                 break
-            nla_type_base = nla_type & 0x7FFF
-            if nla_type_base == IFLAAttr.ALT_IFNAME:
-                attr_data = prop_data[offset+4:offset+nla_len]
-                altnames.append(
-                    attr_data.rstrip(b"\x00").decode("utf-8", errors="replace")
-                )
+            if nla_type & 0x7FFF == _IFLA_ALT_IFNAME:
+                stop = prop_data.find(b"\x00", offset + 4, offset + nla_len)
+                if stop < 0:
+                    stop = offset + nla_len
+                altnames.append(str(prop_view[offset + 4 : stop], "utf-8", "replace"))
             offset += (nla_len + 3) & ~3
 
     # Parse IFLA_LINKINFO for bond/bridge/vlan details
     kind = None
-    bond_mode = None
-    bond_miimon = None
-    bond_xmit_hash_policy = None
-    bond_lacpdu_rate = None
-    bond_primary = None
-    bridge_stp_state = None
-    bridge_priority = None
-    vlan_id = None
-    vlan_parent = None
-
-    if IFLAAttr.LINKINFO in attrs:
-        linkinfo_attrs = parse_attrs(attrs[IFLAAttr.LINKINFO])
-        if IFLAInfoAttr.KIND in linkinfo_attrs:
-            kind = (
-                linkinfo_attrs[IFLAInfoAttr.KIND]
-                .rstrip(b"\x00")
-                .decode("utf-8", errors="replace")
-            )
-
-        if IFLAInfoAttr.DATA in linkinfo_attrs:
-            info_data = parse_attrs(linkinfo_attrs[IFLAInfoAttr.DATA])
-
-            if kind == "bond":
-                if IFLABondAttr.MODE in info_data:
-                    bond_mode = info_data[IFLABondAttr.MODE][0]
-                if IFLABondAttr.MIIMON in info_data:
-                    bond_miimon = struct.unpack(
-                        "I", info_data[IFLABondAttr.MIIMON][:4]
-                    )[0]
-                if IFLABondAttr.XMIT_HASH_POLICY in info_data:
-                    bond_xmit_hash_policy = info_data[IFLABondAttr.XMIT_HASH_POLICY][0]
-                if IFLABondAttr.AD_LACP_RATE in info_data:
-                    bond_lacpdu_rate = info_data[IFLABondAttr.AD_LACP_RATE][0]
-                if IFLABondAttr.PRIMARY in info_data:
-                    bond_primary = struct.unpack(
-                        "I", info_data[IFLABondAttr.PRIMARY][:4]
-                    )[0]
-
-            elif kind == "bridge":
-                if IFLABridgeAttr.STP_STATE in info_data:
-                    bridge_stp_state = struct.unpack(
-                        "I", info_data[IFLABridgeAttr.STP_STATE][:4]
-                    )[0]
-                if IFLABridgeAttr.PRIORITY in info_data:
-                    bridge_priority = struct.unpack(
-                        "H", info_data[IFLABridgeAttr.PRIORITY][:2]
-                    )[0]
-
-            elif kind == "vlan":
-                if IFLAVlanAttr.ID in info_data:
-                    vlan_id = struct.unpack("H", info_data[IFLAVlanAttr.ID][:2])[0]
+    if (linkinfo := attrs.get(_IFLA_LINKINFO)) is not None:
+        # Slot lists rather than dicts: only a handful of types are read
+        linkinfo_attrs: list[bytes | None] = [None] * _LINKINFO_SLOTS
+        parse_attrs_into(linkinfo, 0, linkinfo_attrs)
+        if (raw := linkinfo_attrs[_IFLA_INFO_KIND]) is not None:
+            kind = _string(raw)
+
+        raw = linkinfo_attrs[_IFLA_INFO_DATA]
+        if raw is not None and kind in _INFO_DATA_FIELDS:
+            data_fields = _INFO_DATA_FIELDS[kind]
+            info_data: list[bytes | None] = [None] * _INFO_DATA_SLOTS[kind]
+            parse_attrs_into(raw, 0, info_data)
+            for attr_type, (field, decode) in data_fields.items():
+                if (data := info_data[attr_type]) is not None:
+                    fields[field] = decode(data)
 
     # Parse IFLA_LINK for vlan parent interface index
-    if IFLAAttr.LINK in attrs and kind == "vlan":
-        vlan_parent = struct.unpack("I", attrs[IFLAAttr.LINK][:4])[0]
+    if kind == "vlan" and (raw := attrs.get(_IFLA_LINK)) is not None:
+        fields["vlan_parent"] = _u32(raw)
 
     return ifname, LinkInfo(
         index=ifi_index,
         flags=ifi_flags,
-        mtu=mtu,
-        operstate=operstate,
-        address=address,
-        perm_address=perm_address,
-        broadcast=broadcast,
-        txqlen=txqlen,
-        min_mtu=min_mtu,
-        max_mtu=max_mtu,
-        carrier=carrier,
-        carrier_changes=carrier_changes,
-        num_tx_queues=num_tx_queues,
-        num_rx_queues=num_rx_queues,
-        master=master,
-        parentbus=parentbus,
-        parentdev=parentdev,
         altnames=tuple(altnames),
         kind=kind,
-        bond_mode=bond_mode,
-        bond_miimon=bond_miimon,
-        bond_xmit_hash_policy=bond_xmit_hash_policy,
-        bond_lacpdu_rate=bond_lacpdu_rate,
-        bond_primary=bond_primary,
-        bridge_stp_state=bridge_stp_state,
-        bridge_priority=bridge_priority,
-        vlan_id=vlan_id,
-        vlan_parent=vlan_parent,
+        **fields,
     )
 
 
@@ -225,20 +204,10 @@ def link_exists(name: str) -> bool:
 
 def get_links(sock: socket.socket) -> dict[str, LinkInfo]:
     """Get all network interfaces."""
-    # Build ifinfomsg: family(1) + pad(1) + type(2) + index(4) + flags(4) + change(4) = 16 bytes
-    ifinfomsg = struct.pack("BxHiII", AddressFamily.UNSPEC, 0, 0, 0, 0)
-    # Add IFLA_EXT_MASK to request extended info but skip stats
-    ext_mask = pack_nlattr_u32(
-        IFLAAttr.EXT_MASK, RTEXTFilter.VF | RTEXTFilter.SKIP_STATS
-    )
-    payload = ifinfomsg + ext_mask
-    msg = pack_nlmsg(RTMType.GETLINK, NLMsgFlags.REQUEST | NLMsgFlags.DUMP, payload)
-    sock.send(msg)
+    sock.send(_GETLINK_DUMP)
 
     links: dict[str, LinkInfo] = {}
-    for msg_type, payload in recv_msgs(sock):
-        if msg_type != RTMType.NEWLINK:
-            continue
+    for _, payload in recv_msgs(sock, accept=_ACCEPT_NEWLINK):
         if result := _parse_link_payload(payload):
             ifname, link_info = result
             links[ifname] = link_info
@@ -248,20 +217,27 @@ def get_links(sock: socket.socket) -> dict[str, LinkInfo]:
 
 def get_link(sock: socket.socket, name: str) -> LinkInfo:
     """Get link info for a single interface by name."""
-    try:
-        index = socket.if_nametoindex(name)
-    except OSError:
+    # The kernel resolves IFLA_IFNAME itself when ifi_index is 0, which saves
+    # the if_nametoindex() round trip; names longer than IFNAMSIZ can't exist
+    if len(name.encode()) >= _IFNAMSIZ:
         raise DeviceNotFound(f"No such device: {name}")
 
-    # Build ifinfomsg with specific index
-    ifinfomsg = struct.pack("BxHiII", AddressFamily.UNSPEC, 0, index, 0, 0)
-    msg = pack_nlmsg(RTMType.GETLINK, NLMsgFlags.REQUEST | NLMsgFlags.ACK, ifinfomsg)
+    ifinfomsg = _IFINFOMSG.pack(AddressFamily.UNSPEC, 0, 0, 0, 0)
+    payload = b"".join(
+        (
+            ifinfomsg,
+            pack_nlattr_str(IFLAAttr.IFNAME, name),
+            pack_nlattr_u32(IFLAAttr.EXT_MASK, RTEXTFilter.SKIP_STATS),
+        )
+    )
+    msg = pack_nlmsg(RTMType.GETLINK, NLMsgFlags.REQUEST | NLMsgFlags.ACK, payload)
     sock.send(msg)
 
-    for msg_type, payload in recv_msgs(sock):
-        if msg_type != RTMType.NEWLINK:
-            continue
-        if result := _parse_link_payload(payload):
-            return result[1]
+    try:
+        for _, payload in recv_msgs(sock, accept=_ACCEPT_NEWLINK):
+            if result := _parse_link_payload(payload):
+                return result[1]
+    except DeviceNotFound:
+        pass
 
     raise DeviceNotFound(f"No such device: {name}")
@@ -1,6 +1,9 @@
+import functools
 import socket
 import struct
+from typing import Callable
 
+from truenas_pynetif.address._link_helpers import _resolve_index
 from truenas_pynetif.address.constants import (
     AddressFamily,
     RTAAttr,
@@ -11,12 +14,12 @@ from truenas_pynetif.address.constants import (
     RTScope,
     RTTable,
 )
-from truenas_pynetif.netlink import DeviceNotFound, RouteInfo
+from truenas_pynetif.netlink import RouteInfo
 from truenas_pynetif.netlink._core import (
+    _U32,
     SOL_NETLINK,
     NetlinkSockOpt,
     NLMsgFlags,
-    format_address,
     pack_nlattr_u32,
     pack_nlmsg,
     parse_attrs,
@@ -26,6 +29,39 @@ from truenas_pynetif.netlink._core import (
 
 __all__ = ("get_routes", "get_link_routes", "get_default_route")
 
+# rtmsg: family, dst_len, src_len, tos, table, protocol, scope, type (1 each) + flags(4)
+_RTMSG = struct.Struct("BBBBBBBBI")
+
+# Plain int copies of the enum members used for every route
+_RTM_NEWROUTE = int(RTMType.NEWROUTE)
+_RTA_DST = int(RTAAttr.DST)
+_RTA_GATEWAY = int(RTAAttr.GATEWAY)
+_RTA_PREFSRC = int(RTAAttr.PREFSRC)
+_RTA_OIF = int(RTAAttr.OIF)
+_RTA_PRIORITY = int(RTAAttr.PRIORITY)
+_RTA_TABLE = int(RTAAttr.TABLE)
+_RTM_F_CLONED = int(RTMFlags.CLONED)
+_ACCEPT_NEWROUTE = frozenset((_RTM_NEWROUTE,))
+
+
+def _format_inet(data: bytes) -> str | None:
+    return socket.inet_ntop(socket.AF_INET, data[:4]) if len(data) >= 4 else None
+
+
+def _format_inet6(data: bytes) -> str | None:
+    return socket.inet_ntop(socket.AF_INET6, data[:16]) if len(data) >= 16 else None
+
+
+def _no_address(data: bytes) -> str | None:
+    return None
+
+
+# Same results as format_address(), resolved once per route instead of per field
+_ADDRESS_FORMATTERS: dict[int, Callable[[bytes], str | None]] = {
+    AddressFamily.INET: _format_inet,
+    AddressFamily.INET6: _format_inet6,
+}
+
 
 def _parse_route_payload(
     payload: bytes, ifname_cache: dict[int, str | None] | None = None
@@ -45,10 +81,10 @@ def _parse_route_payload(
         rtm_scope,
         rtm_type,
         rtm_flags,
-    ) = struct.unpack_from("BBBBBBBBI", payload, 0)
+    ) = _RTMSG.unpack_from(payload)
 
     # Skip cloned routes
-    if rtm_flags & RTMFlags.CLONED:
+    if rtm_flags & _RTM_F_CLONED:
         return None
 
     # Parse attributes after rtmsg (12 bytes)
@@ -62,20 +98,22 @@ def _parse_route_payload(
     priority = None
     table = rtm_table
 
-    if RTAAttr.DST in attrs:
-        dst = format_address(rtm_family, attrs[RTAAttr.DST])
-    if RTAAttr.GATEWAY in attrs:
-        gateway = format_address(rtm_family, attrs[RTAAttr.GATEWAY])
-    if RTAAttr.PREFSRC in attrs:
-        prefsrc = format_address(rtm_family, attrs[RTAAttr.PREFSRC])
-    if RTAAttr.OIF in attrs and len(attrs[RTAAttr.OIF]) >= 4:
-        oif = struct.unpack("I", attrs[RTAAttr.OIF][:4])[0]
+    # rtm_family is fixed for the whole route, so pick the formatter once
+    fmt = _ADDRESS_FORMATTERS.get(rtm_family, _no_address)
+    if (raw := attrs.get(_RTA_DST)) is not None:
+        dst = fmt(raw)
+    if (raw := attrs.get(_RTA_GATEWAY)) is not None:
+        gateway = fmt(raw)
+    if (raw := attrs.get(_RTA_PREFSRC)) is not None:
+        prefsrc = fmt(raw)
+    if (raw := attrs.get(_RTA_OIF)) is not None and len(raw) >= 4:
+        oif = _U32.unpack_from(raw)[0]
         if ifname_cache is not None:
             oif_name = resolve_ifname(oif, ifname_cache)
-    if RTAAttr.PRIORITY in attrs and len(attrs[RTAAttr.PRIORITY]) >= 4:
-        priority = struct.unpack("I", attrs[RTAAttr.PRIORITY][:4])[0]
-    if RTAAttr.TABLE in attrs and len(attrs[RTAAttr.TABLE]) >= 4:
-        table = struct.unpack("I", attrs[RTAAttr.TABLE][:4])[0]
+    if (raw := attrs.get(_RTA_PRIORITY)) is not None and len(raw) >= 4:
+        priority = _U32.unpack_from(raw)[0]
+    if (raw := attrs.get(_RTA_TABLE)) is not None and len(raw) >= 4:
+        table = _U32.unpack_from(raw)[0]
 
     return RouteInfo(
         family=rtm_family,
@@ -94,10 +132,33 @@ def _parse_route_payload(
     )
 
 
+@functools.lru_cache(maxsize=16)
+def _getroute_dump(family: int, table: int) -> bytes:
+    """Build the RTM_GETROUTE dump request for a family and table."""
+    rtmsg = _RTMSG.pack(
+        family,
+        0,  # rtm_dst_len
+        0,  # rtm_src_len
+        0,  # rtm_tos
+        RTTable.UNSPEC,
+        RTProtocol.UNSPEC,
+        RTScope.UNIVERSE,
+        RTNType.UNSPEC,
+        0,  # rtm_flags
+    )
+    table_attr = pack_nlattr_u32(RTAAttr.TABLE, table)
+    return pack_nlmsg(
+        RTMType.GETROUTE, NLMsgFlags.REQUEST | NLMsgFlags.DUMP, rtmsg + table_attr
+    )
+
+
 def get_routes(
     sock: socket.socket,
     family: int = AddressFamily.UNSPEC,
     table: int = RTTable.MAIN,
+    *,
+    resolve_names: bool = True,
+    ifnames: dict[int, str] | None = None,
 ) -> list[RouteInfo]:
     """Get routing table entries.
 
@@ -105,34 +166,21 @@ def get_routes(
         sock: Netlink socket from netlink_route() context manager
         family: Address family (UNSPEC=all, INET=IPv4, INET6=IPv6)
         table: Routing table ID (default: MAIN=254)
+        resolve_names: Fill in `oif_name` for each route; when False it is
+            left as None and no name lookups are made
+        ifnames: Known index to name mapping (e.g. from get_links()) used
+            before falling back to per-index lookups
 
     Returns:
         List of RouteInfo objects
     """
-    rtmsg = struct.pack(
-        "BBBBBBBBI",
-        family,
-        0,  # rtm_dst_len
-        0,  # rtm_src_len
-        0,  # rtm_tos
-        RTTable.UNSPEC,
-        RTProtocol.UNSPEC,
-        RTScope.UNIVERSE,
-        RTNType.UNSPEC,
-        0,  # rtm_flags
-    )
-
-    table_attr = pack_nlattr_u32(RTAAttr.TABLE, table)
-    payload = rtmsg + table_attr
-
-    msg = pack_nlmsg(RTMType.GETROUTE, NLMsgFlags.REQUEST | NLMsgFlags.DUMP, payload)
-    sock.send(msg)
+    sock.send(_getroute_dump(family, table))
 
     routes: list[RouteInfo] = []
-    ifname_cache: dict[int, str | None] = {}
-    for msg_type, payload in recv_msgs(sock):
-        if msg_type != RTMType.NEWROUTE:
-            continue
+    ifname_cache: dict[int, str | None] | None = None
+    if resolve_names:
+        ifname_cache = dict(ifnames) if ifnames else {}
+    for _, payload in recv_msgs(sock, accept=_ACCEPT_NEWROUTE):
         if route_info := _parse_route_payload(payload, ifname_cache):
             routes.append(route_info)
 
@@ -156,15 +204,11 @@ def get_link_routes(
     Returns:
         List of RouteInfo objects for the specified interface
     """
-    try:
-        index = socket.if_nametoindex(name)
-    except OSError:
-        raise DeviceNotFound(f"No such device: {name}")
+    index = _resolve_index(name)
 
     sock.setsockopt(SOL_NETLINK, NetlinkSockOpt.GET_STRICT_CHK, 1)
     try:
-        rtmsg = struct.pack(
-            "BBBBBBBBI",
+        rtmsg = _RTMSG.pack(
             family,
             0,
             0,
@@ -187,9 +231,7 @@ def get_link_routes(
 
         ifname_cache: dict[int, str | None] = {index: name}
         routes: list[RouteInfo] = []
-        for msg_type, payload in recv_msgs(sock):
-            if msg_type != RTMType.NEWROUTE:
-                continue
+        for _, payload in recv_msgs(sock, accept=_ACCEPT_NEWROUTE):
             if route_info := _parse_route_payload(payload, ifname_cache):
                 routes.append(route_info)
 
@@ -213,7 +255,26 @@ def get_default_route(
     Returns:
         RouteInfo for the default route, or None if not found
     """
-    for route in get_routes(sock, family=family, table=table):
-        if route.dst is None and route.dst_len == 0:
-            return route
-    return None
+    # A single FIB lookup (RTM_GETROUTE without NLM_F_DUMP) can't be used:
+    # IPv4 has no route to 0.0.0.0 and lookups go through policy rules
+    # rather than `table`. Strict checking makes the kernel honour RTA_TABLE
+    # and only dump the requested table.
+    sock.setsockopt(SOL_NETLINK, NetlinkSockOpt.GET_STRICT_CHK, 1)
+    try:
+        sock.send(_getroute_dump(family, table))
+
+        default: RouteInfo | None = None
+        ifname_cache: dict[int, str | None] = {}
+        for _, payload in recv_msgs(sock, accept=_ACCEPT_NEWROUTE):
+            # The whole dump still has to be drained, but only routes with
+            # rtm_dst_len 0 (second byte of rtmsg) can be a default route
+            if default is not None:
+                continue
+            if len(payload) < 12 or payload[1] != 0:
+                continue
+            route = _parse_route_payload(payload, ifname_cache)
+            if route is not None and route.dst is None:
+                default = route
+        return default
+    finally:
+        sock.setsockopt(SOL_NETLINK, NetlinkSockOpt.GET_STRICT_CHK, 0)
@@ -7,9 +7,17 @@ logger = logging.getLogger(__name__)
 __all__ = ["ipv6_netmask_to_prefixlen"]
 
 
+_ALL_ONES = (1 << 128) - 1
+
+
 def ipv6_netmask_to_prefixlen(netmask: str) -> int:
-    bits = bin(int(ipaddress.IPv6Address(netmask)))[2:].rstrip("0")
-    if not all(c == "1" for c in bits):
+    mask = int(ipaddress.IPv6Address(netmask))
+    if not mask:
+        return 0
+
+    # Host bits are the trailing zeros; everything above them must be set
+    host_bits = (mask & -mask).bit_length() - 1
+    if mask != _ALL_ONES ^ ((1 << host_bits) - 1):
         raise ValueError("Invalid IPv6 netmask %r", netmask)
 
-    return len(bits)
+    return 128 - host_bits
@@ -1,15 +1,14 @@
 import socket
-import struct
-
-from truenas_pynetif.address._link_helpers import _resolve_index, _set_link_flags
-from truenas_pynetif.address.constants import AddressFamily, IFFlags, IFLAAttr, RTMType
-from truenas_pynetif.netlink._core import (
-    NLMsgFlags,
-    pack_nlattr_str,
-    pack_nlattr_u32,
-    pack_nlmsg,
-    recv_msgs,
+
+from truenas_pynetif.address._link_helpers import (
+    _link_attrs_msg,
+    _link_msg,
+    _link_u32_msg,
+    _resolve_index,
+    _set_link_flags,
 )
+from truenas_pynetif.address.constants import IFFlags, IFLAAttr, RTMType
+from truenas_pynetif.netlink._core import pack_nlattr_str, recv_msgs
 
 __all__ = (
     "set_link_up",
@@ -51,12 +50,7 @@ def set_link_mtu(
         index: Interface index (mutually exclusive with name)
     """
     index = _resolve_index(name, index)
-    ifinfomsg = struct.pack("BxHiII", AddressFamily.UNSPEC, 0, index, 0, 0)
-    attrs = pack_nlattr_u32(IFLAAttr.MTU, mtu)
-    msg = pack_nlmsg(
-        RTMType.NEWLINK, NLMsgFlags.REQUEST | NLMsgFlags.ACK, ifinfomsg + attrs
-    )
-    sock.send(msg)
+    sock.send(_link_u32_msg(index, IFLAAttr.MTU, mtu))
     recv_msgs(sock)
 
 
@@ -80,11 +74,8 @@ def set_link_name(
         index: Current interface index (mutually exclusive with name)
     """
     index = _resolve_index(name, index)
-    ifinfomsg = struct.pack("BxHiII", AddressFamily.UNSPEC, 0, index, 0, 0)
     attrs = pack_nlattr_str(IFLAAttr.IFNAME, new_name)
-    msg = pack_nlmsg(
-        RTMType.NEWLINK, NLMsgFlags.REQUEST | NLMsgFlags.ACK, ifinfomsg + attrs
-    )
+    msg = _link_attrs_msg(index, attrs)
     sock.send(msg)
     recv_msgs(sock)
 
@@ -109,11 +100,8 @@ def set_link_alias(
         index: Interface index (mutually exclusive with name)
     """
     index = _resolve_index(name, index)
-    ifinfomsg = struct.pack("BxHiII", AddressFamily.UNSPEC, 0, index, 0, 0)
     attrs = pack_nlattr_str(IFLAAttr.IFALIAS, alias)
-    msg = pack_nlmsg(
-        RTMType.NEWLINK, NLMsgFlags.REQUEST | NLMsgFlags.ACK, ifinfomsg + attrs
-    )
+    msg = _link_attrs_msg(index, attrs)
     sock.send(msg)
     recv_msgs(sock)
 
@@ -123,7 +111,5 @@ def delete_link(
 ) -> None:
     """Delete a virtual interface (vlan, bond, dummy, etc)."""
     index = _resolve_index(name, index)
-    ifinfomsg = struct.pack("BxHiII", AddressFamily.UNSPEC, 0, index, 0, 0)
-    msg = pack_nlmsg(RTMType.DELLINK, NLMsgFlags.REQUEST | NLMsgFlags.ACK, ifinfomsg)
-    sock.send(msg)
+    sock.send(_link_msg(RTMType.DELLINK, index))
     recv_msgs(sock)
@@ -3,8 +3,8 @@ from __future__ import annotations
 import errno
 import ipaddress
 import socket
-import struct
 
+from truenas_pynetif.address._link_helpers import _resolve_index
 from truenas_pynetif.address.constants import (
     AddressFamily,
     RTAAttr,
@@ -14,7 +14,7 @@ from truenas_pynetif.address.constants import (
     RTScope,
     RTTable,
 )
-from truenas_pynetif.address.get_routes import get_routes
+from truenas_pynetif.address.get_routes import _RTMSG, get_routes
 from truenas_pynetif.netlink._core import (
     NLMsgFlags,
     pack_nlattr,
@@ -74,8 +74,7 @@ def _build_route_msg(
         else:
             scope = RTScope.LINK
 
-    rtmsg = struct.pack(
-        "BBBBBBBBI",
+    rtmsg = _RTMSG.pack(
         family,
         dst_len,
         0,
@@ -96,7 +95,7 @@ def _build_route_msg(
         attrs += pack_nlattr(RTAAttr.GATEWAY, gw_obj.packed)
 
     if name is not None and index is None:
-        index = socket.if_nametoindex(name)
+        index = _resolve_index(name)
     if index is not None:
         attrs += pack_nlattr_u32(RTAAttr.OIF, index)
 
@@ -280,7 +279,7 @@ def flush_routes(sock: socket.socket, table: int) -> None:
         sock: Netlink socket from netlink_route()
         table: Routing table ID to flush
     """
-    for route in get_routes(sock, table=table):
+    for route in get_routes(sock, table=table, resolve_names=False):
         # Skip kernel-managed routes
         if route.protocol == RTProtocol.KERNEL:
             continue
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import functools
 import ipaddress
 import socket
 import struct
@@ -12,6 +13,7 @@ from truenas_pynetif.address.constants import (
     RTTable,
 )
 from truenas_pynetif.netlink._core import (
+    _U32,
     NLMsgFlags,
     format_address,
     pack_nlattr,
@@ -24,6 +26,40 @@ from truenas_pynetif.netlink.dataclass_types import RuleInfo
 
 __all__ = ("get_rules", "add_rule", "delete_rule")
 
+# fib_rule_hdr: family, dst_len, src_len, tos, table, res1, res2, action (1 each)
+# + flags(4)
+_FIB_RULE_HDR = struct.Struct("BBBBBBBBI")
+
+# Plain int copies of the enum members used for every rule
+_RTM_NEWRULE = int(RTMType.NEWRULE)
+_ACCEPT_NEWRULE = frozenset((_RTM_NEWRULE,))
+_FRA_DST = int(FRAAttr.DST)
+_FRA_SRC = int(FRAAttr.SRC)
+_FRA_IIFNAME = int(FRAAttr.IIFNAME)
+_FRA_PRIORITY = int(FRAAttr.PRIORITY)
+_FRA_FWMARK = int(FRAAttr.FWMARK)
+_FRA_TABLE = int(FRAAttr.TABLE)
+_FRA_PROTOCOL = int(FRAAttr.PROTOCOL)
+
+
+@functools.lru_cache(maxsize=4)
+def _getrule_dump(family: int) -> bytes:
+    """Build the RTM_GETRULE dump request for a family."""
+    fib_rule_hdr = _FIB_RULE_HDR.pack(
+        family,
+        0,
+        0,
+        0,
+        RTTable.UNSPEC,
+        0,
+        0,
+        FRAction.TO_TBL,
+        0,
+    )
+    return pack_nlmsg(
+        RTMType.GETRULE, NLMsgFlags.REQUEST | NLMsgFlags.DUMP, fib_rule_hdr
+    )
+
 
 def get_rules(
     sock: socket.socket,
@@ -38,30 +74,10 @@ def get_rules(
     Returns:
         List of RuleInfo objects for all matching rules.
     """
-    fib_rule_hdr = struct.pack(
-        "BBBBBBBBI",
-        family,
-        0,
-        0,
-        0,
-        RTTable.UNSPEC,
-        0,
-        0,
-        FRAction.TO_TBL,
-        0,
-    )
-
-    msg = pack_nlmsg(
-        RTMType.GETRULE,
-        NLMsgFlags.REQUEST | NLMsgFlags.DUMP,
-        fib_rule_hdr,
-    )
-    sock.send(msg)
+    sock.send(_getrule_dump(family))
 
     rules: list[RuleInfo] = []
-    for msg_type, payload in recv_msgs(sock):
-        if msg_type != RTMType.NEWRULE:
-            continue
+    for _, payload in recv_msgs(sock, accept=_ACCEPT_NEWRULE):
         if len(payload) < 12:
             continue
 
@@ -75,37 +91,37 @@ def get_rules(
             rule_res2,
             rule_action,
             rule_flags,
-        ) = struct.unpack_from("BBBBBBBBI", payload, 0)
+        ) = _FIB_RULE_HDR.unpack_from(payload)
 
         attrs = parse_attrs(payload, 12)
 
         table = rule_table
-        if FRAAttr.TABLE in attrs and len(attrs[FRAAttr.TABLE]) >= 4:
-            table = struct.unpack("I", attrs[FRAAttr.TABLE][:4])[0]
+        if (raw := attrs.get(_FRA_TABLE)) is not None and len(raw) >= 4:
+            table = _U32.unpack_from(raw)[0]
 
         priority = None
-        if FRAAttr.PRIORITY in attrs and len(attrs[FRAAttr.PRIORITY]) >= 4:
-            priority = struct.unpack("I", attrs[FRAAttr.PRIORITY][:4])[0]
+        if (raw := attrs.get(_FRA_PRIORITY)) is not None and len(raw) >= 4:
+            priority = _U32.unpack_from(raw)[0]
 
         src = None
-        if FRAAttr.SRC in attrs:
-            src = format_address(rule_family, attrs[FRAAttr.SRC])
+        if (raw := attrs.get(_FRA_SRC)) is not None:
+            src = format_address(rule_family, raw)
 
         dst = None
-        if FRAAttr.DST in attrs:
-            dst = format_address(rule_family, attrs[FRAAttr.DST])
+        if (raw := attrs.get(_FRA_DST)) is not None:
+            dst = format_address(rule_family, raw)
 
         iifname = None
-        if FRAAttr.IIFNAME in attrs:
-            iifname = attrs[FRAAttr.IIFNAME].rstrip(b"\x00").decode()
+        if (raw := attrs.get(_FRA_IIFNAME)) is not None:
+            iifname = raw.rstrip(b"\x00").decode()
 
         fwmark = None
-        if FRAAttr.FWMARK in attrs and len(attrs[FRAAttr.FWMARK]) >= 4:
-            fwmark = struct.unpack("I", attrs[FRAAttr.FWMARK][:4])[0]
+        if (raw := attrs.get(_FRA_FWMARK)) is not None and len(raw) >= 4:
+            fwmark = _U32.unpack_from(raw)[0]
 
         protocol = None
-        if FRAAttr.PROTOCOL in attrs and len(attrs[FRAAttr.PROTOCOL]) >= 1:
-            protocol = attrs[FRAAttr.PROTOCOL][0]
+        if raw := attrs.get(_FRA_PROTOCOL):
+            protocol = raw[0]
 
         rules.append(
             RuleInfo(
@@ -155,8 +171,7 @@ def add_rule(
         src_bytes = network.network_address.packed
         family = AddressFamily.INET if network.version == 4 else AddressFamily.INET6
 
-    fib_rule_hdr = struct.pack(
-        "BBBBBBBBI",
+    fib_rule_hdr = _FIB_RULE_HDR.pack(
         family,
         0,
         src_len,
@@ -199,8 +214,7 @@ def delete_rule(
     Raises:
         NetlinkError: If no rule with this priority exists (errno 2 ENOENT)
     """
-    fib_rule_hdr = struct.pack(
-        "BBBBBBBBI",
+    fib_rule_hdr = _FIB_RULE_HDR.pack(
         family,
         0,
         0,
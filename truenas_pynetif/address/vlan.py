@@ -1,8 +1,7 @@
 import socket
 
-from truenas_pynetif.address._link_helpers import _create_link
+from truenas_pynetif.address._link_helpers import _create_link, _resolve_index
 from truenas_pynetif.address.constants import IFLAAttr, IFLAVlanAttr
-from truenas_pynetif.netlink import DeviceNotFound
 from truenas_pynetif.netlink._core import pack_nlattr_u16, pack_nlattr_u32
 
 __all__ = ("create_vlan",)
@@ -28,10 +27,7 @@ def create_vlan(
     if parent_index is None:
         if parent is None:
             raise ValueError("Either parent or parent_index must be provided")
-        try:
-            parent_index = socket.if_nametoindex(parent)
-        except OSError:
-            raise DeviceNotFound(f"No such device: {parent}")
+        parent_index = _resolve_index(parent)
 
     info_data = pack_nlattr_u16(IFLAVlanAttr.ID, vlan_id)
     extra_attrs = pack_nlattr_u32(IFLAAttr.LINK, parent_index)
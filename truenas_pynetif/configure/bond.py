@@ -5,6 +5,7 @@ import errno
 import socket
 from typing import Literal
 
+from truenas_pynetif.address._link_helpers import _resolve_index
 from truenas_pynetif.address.bond import (
     bond_add_member,
     bond_rem_member,
@@ -110,7 +111,7 @@ def configure_bond(
         needs_down = True
     if config.lacpdu_rate and link.bond_lacpdu_rate != config.lacpdu_rate.value:
         needs_down = True
-    if config.primary and link.bond_primary != socket.if_nametoindex(config.primary):
+    if config.primary and link.bond_primary != _resolve_index(config.primary):
         needs_down = True
     if config.miimon and link.bond_miimon != config.miimon:
         needs_down = True
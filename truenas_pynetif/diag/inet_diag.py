@@ -26,6 +26,10 @@ IPPROTO_TCP = 6
 
 # inet_diag_msg fixed header size (before NLA attributes)
 _INET_DIAG_MSG_SIZE = 72
+# idiag_sport/idiag_dport (network order) and idiag_uid/idiag_inode
+_PORTS = struct.Struct("!HH")
+_UID_INODE = struct.Struct("II")
+_ACCEPT_SOCK_DIAG = frozenset((SOCK_DIAG_BY_FAMILY,))
 
 
 @contextmanager
@@ -58,7 +62,7 @@ def _parse_inet_diag_msg(family: int, payload: bytes) -> InetDiagSockInfo | None
         return None
 
     state = payload[1]
-    sport, dport = struct.unpack_from("!HH", payload, 4)
+    sport, dport = _PORTS.unpack_from(payload, 4)
 
     if family == socket.AF_INET:
         src = socket.inet_ntop(socket.AF_INET, payload[8:12])
@@ -67,7 +71,7 @@ def _parse_inet_diag_msg(family: int, payload: bytes) -> InetDiagSockInfo | None
         src = socket.inet_ntop(socket.AF_INET6, payload[8:24])
         dst = socket.inet_ntop(socket.AF_INET6, payload[24:40])
 
-    uid, inode = struct.unpack_from("II", payload, 64)
+    uid, inode = _UID_INODE.unpack_from(payload, 64)
 
     return InetDiagSockInfo(
         family=family,
@@ -101,9 +105,7 @@ def get_inet_diag(
     sock.send(msg)
 
     results: list[InetDiagSockInfo] = []
-    for msg_type, payload in recv_msgs(sock):
-        if msg_type != SOCK_DIAG_BY_FAMILY:
-            continue
+    for _, payload in recv_msgs(sock, accept=_ACCEPT_SOCK_DIAG):
         if entry := _parse_inet_diag_msg(family, payload):
             results.append(entry)
 
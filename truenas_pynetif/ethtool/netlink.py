@@ -1,5 +1,4 @@
 import socket
-import struct
 import threading
 from contextvars import ContextVar
 from dataclasses import dataclass, field
@@ -36,10 +35,14 @@ from truenas_pynetif.ethtool.constants import (
 )
 from truenas_pynetif.netlink import DeviceNotFound, NetlinkError, OperationNotSupported
 from truenas_pynetif.netlink._core import (
+    _NLATTR_HDR,
+    _U16,
+    _U32,
     pack_genlmsg,
     pack_nlattr,
     pack_nlattr_nested,
     pack_nlattr_str,
+    pack_nlattr_u8,
     pack_nlattr_u32,
     parse_attrs,
     recv_msgs,
@@ -197,7 +200,7 @@ class EthtoolNetlink:
             if msg_type == GENL_ID_CTRL:
                 parsed_attrs = parse_attrs(payload, 4)
                 if CtrlAttr.FAMILY_ID in parsed_attrs:
-                    family_id: int = struct.unpack("H", parsed_attrs[CtrlAttr.FAMILY_ID][:2])[0]
+                    family_id: int = _U16.unpack_from(parsed_attrs[CtrlAttr.FAMILY_ID])[0]
                     return family_id
         raise NetlinkError(f"Could not resolve family: {name}")
 
@@ -224,7 +227,7 @@ class EthtoolNetlink:
         attrs = parse_attrs(data)
         size = 0
         if EthtoolABitset.SIZE in attrs:
-            size = struct.unpack("I", attrs[EthtoolABitset.SIZE][:4])[0]
+            size = _U32.unpack_from(attrs[EthtoolABitset.SIZE])[0]
         value_bits: set[int] = set()
         mask_bits: set[int] = set()
         if EthtoolABitset.VALUE in attrs:
@@ -243,7 +246,7 @@ class EthtoolNetlink:
             bits_data = attrs[EthtoolABitset.BITS]
             offset = 0
             while offset + 4 <= len(bits_data):
-                nla_len, nla_type = struct.unpack_from("HH", bits_data, offset)
+                nla_len, nla_type = _NLATTR_HDR.unpack_from(bits_data, offset)
                 if nla_len < 4:
                     break
                 if (nla_type & 0x7FFF) == EthtoolABitsetBits.BIT:
@@ -252,7 +255,7 @@ class EthtoolNetlink:
                     bit_index = None
                     bit_value = True
                     if EthtoolABitsetBit.INDEX in bit_attrs:
-                        bit_index = struct.unpack("I", bit_attrs[EthtoolABitsetBit.INDEX][:4])[0]
+                        bit_index = _U32.unpack_from(bit_attrs[EthtoolABitsetBit.INDEX])[0]
                     if EthtoolABitsetBit.VALUE in bit_attrs:
                         val_data = bit_attrs[EthtoolABitsetBit.VALUE]
                         if len(val_data) > 0:
@@ -283,7 +286,7 @@ class EthtoolNetlink:
             if msg_type == self._family_id:
                 attrs = parse_attrs(payload, 4)
                 if EthtoolALinkmodes.SPEED in attrs:
-                    speed = struct.unpack("I", attrs[EthtoolALinkmodes.SPEED][:4])[0]
+                    speed = _U32.unpack_from(attrs[EthtoolALinkmodes.SPEED])[0]
                     if speed != 0xFFFFFFFF:
                         result["speed"] = speed
                 if EthtoolALinkmodes.DUPLEX in attrs:
@@ -370,7 +373,7 @@ class EthtoolNetlink:
                 is_auto = attrs[EthtoolAFec.AUTO][0] != 0
             if EthtoolAFec.ACTIVE in attrs:
                 # ACTIVE is a plain u32 bit index (nla_put_u32), not a bitset
-                active_bit = struct.unpack_from("I", attrs[EthtoolAFec.ACTIVE])[0]
+                active_bit = _U32.unpack_from(attrs[EthtoolAFec.ACTIVE])[0]
                 try:
                     active_fec = FecMode(active_bit).name  # type: ignore[assignment]
                 except ValueError:
@@ -407,7 +410,7 @@ class EthtoolNetlink:
         header = self._make_header(ifname)
 
         if mode == "AUTO":
-            fec_auto = pack_nlattr(EthtoolAFec.AUTO, struct.pack("B", 1))
+            fec_auto = pack_nlattr_u8(EthtoolAFec.AUTO, 1)
             attrs = header + fec_auto
         else:
             try:
@@ -419,7 +422,7 @@ class EthtoolNetlink:
             bitset_size = max(all_fec_bits) + 1
             bitset = self._pack_compact_bitset([fec_mode.value], all_fec_bits, bitset_size)
             modes = pack_nlattr_nested(EthtoolAFec.MODES, bitset)
-            fec_auto = pack_nlattr(EthtoolAFec.AUTO, struct.pack("B", 0))
+            fec_auto = pack_nlattr_u8(EthtoolAFec.AUTO, 0)
             attrs = header + modes + fec_auto
 
         msg = self._pack_genlmsg(self._family_id, EthtoolMsg.FEC_SET, 1, attrs)
@@ -517,7 +520,7 @@ class EthtoolNetlink:
     def _parse_stringsets(self, data: bytes, names: dict[int, str]) -> None:
         offset = 0
         while offset + 4 <= len(data):
-            nla_len, nla_type = struct.unpack_from("HH", data, offset)
+            nla_len, nla_type = _NLATTR_HDR.unpack_from(data, offset)
             if nla_len < 4:
                 break
             if (nla_type & 0x7FFF) == EthtoolAStringsets.STRINGSET:
@@ -532,13 +535,13 @@ class EthtoolNetlink:
     def _parse_strings(self, data: bytes, names: dict[int, str]) -> None:
         offset = 0
         while offset + 4 <= len(data):
-            nla_len, nla_type = struct.unpack_from("HH", data, offset)
+            nla_len, nla_type = _NLATTR_HDR.unpack_from(data, offset)
             if nla_len < 4:
                 break
             if (nla_type & 0x7FFF) == EthtoolAStrings.STRING:
                 string_attrs = parse_attrs(data[offset + 4 : offset + nla_len])
                 if EthtoolAString.INDEX in string_attrs and EthtoolAString.VALUE in string_attrs:
-                    idx = struct.unpack("I", string_attrs[EthtoolAString.INDEX][:4])[0]
+                    idx = _U32.unpack_from(string_attrs[EthtoolAString.INDEX])[0]
                     val = string_attrs[EthtoolAString.VALUE].rstrip(b"\x00").decode("utf-8", errors="replace")
                     names[idx] = val
             offset += (nla_len + 3) & ~3
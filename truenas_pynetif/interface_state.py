@@ -239,8 +239,10 @@ def list_interface_states(timeout: float = 5.0) -> dict[str, InterfaceState]:
                 # Get all links
                 links = get_links(sock)
 
-                # Get all addresses with interface names
-                all_addresses = get_addresses(sock)
+                # Get all addresses, naming them from the links just dumped
+                all_addresses = get_addresses(
+                    sock, ifnames={link.index: name for name, link in links.items()}
+                )
 
             # Group addresses by interface name
             addresses_by_name: dict[str, list[AddressInfo]] = {}
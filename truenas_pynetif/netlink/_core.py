@@ -1,7 +1,8 @@
 import socket
 import struct
+import threading
 from contextlib import contextmanager
-from typing import Generator
+from typing import Container, Generator
 
 from truenas_pynetif.netlink._exceptions import (
     DeviceNotFound,
@@ -20,8 +21,42 @@ GENL_ID_CTRL = 0x10
 # Socket options
 SOL_NETLINK = 270
 
+# Maximum number of requests packed into a single batched netlink send
+_BATCH_MAX = 64
+
+# Receive buffer size and per-thread reusable buffer for recv_msgs()
+_RECV_BUFSIZE = 65536
+_recv_local = threading.local()
+
+# nlmsghdr: len(4) + type(2) + flags(2) + seq(4) + pid(4), host byte order
+_NLMSGHDR = struct.Struct("IHHII")
+# Leading len/type/flags of nlmsghdr, all recv_msgs() needs per message
+_NLMSGHDR_LTF = struct.Struct("IHH")
+# nlmsgerr: error(4), followed by the offending request's header
+_NLMSGERR = struct.Struct("i")
+# nlattr header: len(2) + type(2), host byte order
+_NLATTR_HDR = struct.Struct("HH")
+# Complete single-value nlattrs, value padded to the 4-byte alignment
+_NLATTR_U8 = struct.Struct("HHB3x")
+_NLATTR_U16 = struct.Struct("HHH2x")
+_NLATTR_U32 = struct.Struct("HHI")
+# Host byte order u16/u32 attribute payloads
+_U16 = struct.Struct("H")
+_U32 = struct.Struct("I")
+
+# ifinfomsg: family(1) + pad(1) + type(2) + index(4) + flags(4) + change(4)
+_IFINFOMSG = struct.Struct("BxHiII")
+# AF_UNSPEC with no type/flags/change is all zeroes apart from the index
+_IFINFOMSG_UNSPEC = struct.Struct("4xi8x")
+# RTM_NEWLINK and IFLA_IFNAME as plain ints for the link dump parsers
+# (RTMType and IFLAAttr live in the address package, which imports this one)
+_RTM_NEWLINK = 16
+_IFLA_IFNAME = 3
+_ACCEPT_NEWLINK = frozenset((_RTM_NEWLINK,))
+
 
 class NetlinkSockOpt:
+    CAP_ACK = 10
     GET_STRICT_CHK = 12
 
 
@@ -33,6 +68,7 @@ class NLMsgFlags:
     REQUEST = 0x01
     MULTI = 0x02
     ACK = 0x04
+    ECHO = 0x08
     EXCL = 0x200
     CREATE = 0x400
     ROOT = 0x100
@@ -53,6 +89,8 @@ def netlink_route() -> Generator[socket.socket, None, None]:
     """Context manager for NETLINK_ROUTE socket."""
     sock = socket.socket(socket.AF_NETLINK, socket.SOCK_RAW, NETLINK_ROUTE)
     sock.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, 1048576)
+    # ACKs carry only the request's nlmsghdr instead of echoing the whole message
+    sock.setsockopt(SOL_NETLINK, NetlinkSockOpt.CAP_ACK, 1)
     sock.bind((0, 0))
     try:
         yield sock
@@ -77,7 +115,7 @@ def pack_nlattr(attr_type: int, data: bytes) -> bytes:
     nla_len = 4 + len(data)
     padded_len = (nla_len + 3) & ~3
     padding = padded_len - nla_len
-    return struct.pack("HH", nla_len, attr_type) + data + b"\x00" * padding
+    return _NLATTR_HDR.pack(nla_len, attr_type) + data + b"\x00" * padding
 
 
 def pack_nlattr_str(attr_type: int, s: str) -> bytes:
@@ -87,17 +125,17 @@ def pack_nlattr_str(attr_type: int, s: str) -> bytes:
 
 def pack_nlattr_u8(attr_type: int, val: int) -> bytes:
     """Pack a u8 netlink attribute."""
-    return pack_nlattr(attr_type, struct.pack("B", val))
+    return _NLATTR_U8.pack(5, attr_type, val)
 
 
 def pack_nlattr_u16(attr_type: int, val: int) -> bytes:
     """Pack a u16 netlink attribute."""
-    return pack_nlattr(attr_type, struct.pack("H", val))
+    return _NLATTR_U16.pack(6, attr_type, val)
 
 
 def pack_nlattr_u32(attr_type: int, val: int) -> bytes:
     """Pack a u32 netlink attribute."""
-    return pack_nlattr(attr_type, struct.pack("I", val))
+    return _NLATTR_U32.pack(8, attr_type, val)
 
 
 def pack_nlattr_nested(attr_type: int, attrs: bytes) -> bytes:
@@ -108,7 +146,7 @@ def pack_nlattr_nested(attr_type: int, attrs: bytes) -> bytes:
 def pack_nlmsg(msg_type: int, flags: int, payload: bytes, seq: int = 1) -> bytes:
     """Pack a netlink message."""
     nlmsg_len = 16 + len(payload)
-    return struct.pack("IHHII", nlmsg_len, msg_type, flags, seq, 0) + payload
+    return _NLMSGHDR.pack(nlmsg_len, msg_type, flags, seq, 0) + payload
 
 
 def pack_genlmsg(
@@ -120,61 +158,137 @@ def pack_genlmsg(
     return pack_nlmsg(family_id, NLMsgFlags.REQUEST | NLMsgFlags.ACK, payload, seq)
 
 
-def recv_msgs(sock: socket.socket) -> list[tuple[int, bytes]]:
-    """Receive and parse netlink messages from socket."""
+def _error_from_errno(error: int) -> NetlinkError:
+    """Map a positive errno from an NLMSG_ERROR reply to an exception."""
+    if error == 19:  # ENODEV
+        return DeviceNotFound("No such device")
+    elif error == 95:  # EOPNOTSUPP
+        return OperationNotSupported("Operation not supported")
+    elif error == 16:  # EBUSY
+        return DumpInterrupted("Netlink socket busy")
+    return NetlinkError(f"Netlink error: {error}", error_code=error)
+
+
+def _recv_buffer() -> bytearray:
+    """Return this thread's reusable receive buffer."""
+    buf: bytearray | None = getattr(_recv_local, "buf", None)
+    if buf is None:
+        buf = _recv_local.buf = bytearray(_RECV_BUFSIZE)
+    return buf
+
+
+def recv_msgs(
+    sock: socket.socket,
+    expected: int = 1,
+    accept: Container[int] | None = None,
+) -> list[tuple[int, bytes]]:
+    """Receive and parse netlink messages from socket.
+
+    Reads until `expected` requests have been answered by an ACK or
+    NLMSG_DONE. When several requests were sent in one batch, every reply
+    is drained before the first error is raised so that no stale ACKs are
+    left on the socket; the error's `batch_index` is the position of the
+    request that failed.
+
+    If `accept` is given, only messages whose type is in it are returned;
+    the payloads of the others are never copied out of the receive buffer.
+    """
     messages = []
-    while True:
-        data = sock.recv(65536)
+    first_error: NetlinkError | None = None
+    answered = 0
+    buf = _recv_buffer()
+    view = memoryview(buf)
+    unpack_hdr = _NLMSGHDR_LTF.unpack_from
+    while expected > 0:
+        nbytes = sock.recv_into(buf)
+        data = view[:nbytes]
         offset = 0
-        done = False
-        while offset < len(data):
-            if offset + 16 > len(data):
+        while offset < nbytes:
+            if offset + 16 > nbytes:
                 break
-            nlmsg_len, nlmsg_type, nlmsg_flags, nlmsg_seq, nlmsg_pid = (
-                struct.unpack_from("IHHII", data, offset)
-            )
+            nlmsg_len, nlmsg_type, nlmsg_flags = unpack_hdr(data, offset)
             if nlmsg_len < 16:
                 break
             if nlmsg_flags & NLMsgFlags.DUMP_INTR:
                 raise DumpInterrupted("Netlink dump was interrupted")
             if nlmsg_type == NLMsgType.ERROR:
-                if offset + 20 <= len(data):
-                    error = struct.unpack_from("i", data, offset + 16)[0]
-                    if error < 0:
-                        error = -error
-                        if error == 19:  # ENODEV
-                            raise DeviceNotFound("No such device")
-                        elif error == 95:  # EOPNOTSUPP
-                            raise OperationNotSupported("Operation not supported")
-                        elif error == 16:  # EBUSY
-                            raise DumpInterrupted("Netlink socket busy")
-                        raise NetlinkError(f"Netlink error: {error}", error_code=error)
-                done = True
+                if offset + 20 <= nbytes:
+                    error = _NLMSGERR.unpack_from(data, offset + 16)[0]
+                    if error < 0 and first_error is None:
+                        first_error = _error_from_errno(-error)
+                        first_error.batch_index = answered
+                expected -= 1
+                answered += 1
             elif nlmsg_type == NLMsgType.DONE:
-                done = True
-            else:
-                payload = data[offset + 16 : offset + nlmsg_len]
+                expected -= 1
+                answered += 1
+            elif accept is None or nlmsg_type in accept:
+                payload = bytes(data[offset + 16 : offset + nlmsg_len])
                 messages.append((nlmsg_type, payload))
             offset += (nlmsg_len + 3) & ~3
-        if done:
-            break
+    if first_error is not None:
+        raise first_error
+    return messages
+
+
+def send_batch(sock: socket.socket, msgs: list[bytes]) -> list[tuple[int, bytes]]:
+    """Send several netlink requests in one datagram and collect the replies.
+
+    Each request must ask for an ACK. The kernel processes the whole
+    datagram before sendmsg() returns, so every ACK is already queued when
+    the replies are drained.
+
+    A failing request does not stop the kernel from applying the others
+    sent in the same datagram, but no further datagram is sent after it.
+    The raised NetlinkError's `batch_index` is the position in `msgs` of
+    the first request that failed; every request before it was applied.
+    """
+    messages = []
+    for i in range(0, len(msgs), _BATCH_MAX):
+        batch = msgs[i : i + _BATCH_MAX]
+        sock.sendmsg(batch)
+        try:
+            messages.extend(recv_msgs(sock, expected=len(batch)))
+        except NetlinkError as e:
+            if e.batch_index is not None:
+                e.batch_index += i
+            raise
     return messages
 
 
 def parse_attrs(data: bytes, offset: int = 0) -> dict[int, bytes]:
     """Parse netlink attributes from data."""
     attrs = {}
-    while offset + 4 <= len(data):
-        nla_len, nla_type = struct.unpack_from("HH", data, offset)
+    unpack_hdr = _NLATTR_HDR.unpack_from
+    end = len(data) - 4
+    while offset <= end:
+        nla_len, nla_type = unpack_hdr(data, offset)
         if nla_len < 4:
             break
-        nla_type_base = nla_type & 0x7FFF
-        attr_data = data[offset + 4 : offset + nla_len]
-        attrs[nla_type_base] = attr_data
+        attrs[nla_type & 0x7FFF] = data[offset + 4 : offset + nla_len]
         offset += (nla_len + 3) & ~3
     return attrs
 
 
+def parse_attrs_into(data: bytes, offset: int, out: list[bytes | None]) -> None:
+    """Parse netlink attributes into `out`, indexed by attribute type.
+
+    `out` is a caller-allocated list, typically `[None] * n`; attribute
+    types that do not fit in it are skipped.
+    """
+    unpack_hdr = _NLATTR_HDR.unpack_from
+    end = len(data) - 4
+    slots = len(out)
+    while offset <= end:
+        nla_len, nla_type = unpack_hdr(data, offset)
+        if nla_len < 4:
+            break
+        nla_type &= 0x7FFF
+        if nla_type < slots:
+            out[nla_type] = data[offset + 4 : offset + nla_len]
+        offset += (nla_len + 3) & ~3
+
+
 def format_address(family: int, data: bytes) -> str | None:
     """Format raw address bytes as string."""
     AF_INET = 2
@@ -21,6 +21,8 @@ class NetlinkError(Exception):
     def __init__(self, message: str, error_code: int | None = None):
         super().__init__(message)
         self.errno = error_code
+        # Position of the failing request when several were sent together
+        self.batch_index: int | None = None
 
 
 class DeviceNotFound(NetlinkError):